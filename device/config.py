@@ -45,11 +45,34 @@ LEGACY_KEYS_TO_REMOVE = (
     "api-base",
 )
 
+# Parsed + normalized config, keyed by the file's (size, mtime). Screens
+# reload config on every entry; a flash read + JSON parse each time is
+# wasted work when nothing changed. Callers get a copy (they mutate it).
+# Code that writes config.json itself (not via save_config) must call
+# invalidate_config_cache(): a same-size rewrite can keep the same key
+# when the filesystem doesn't track mtime.
+_cache = None
+_cache_stat = None
+
 
 # ----------------------------
 # Public API
 # ----------------------------
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+        return (st[6], st[8])
+    except Exception:
+        return None
+
+
 def load_config():
+    global _cache, _cache_stat
+    if _cache is not None:
+        key = _stat_key(CONFIG_FILE)
+        if key is not None and key == _cache_stat:
+            return dict(_cache)
+
     try:
         with open(CONFIG_FILE, "r") as f:
             cfg = json.load(f)
@@ -85,11 +108,15 @@ def load_config():
 
     if changed or not file_exists(CONFIG_FILE):
         save_config(cfg)
+    else:
+        _cache = dict(cfg)
+        _cache_stat = _stat_key(CONFIG_FILE)
 
     return cfg
 
 
 def save_config(cfg):
+    global _cache, _cache_stat
     tmp_file = CONFIG_FILE + ".tmp"
 
     with open(tmp_file, "w") as f:
@@ -102,6 +129,16 @@ def save_config(cfg):
 
     os.rename(tmp_file, CONFIG_FILE)
 
+    # What we just wrote is the current config
+    _cache = dict(cfg)
+    _cache_stat = _stat_key(CONFIG_FILE)
+
+
+def invalidate_config_cache():
+    global _cache, _cache_stat
+    _cache = None
+    _cache_stat = None
+
 
 def file_exists(path):
     try:
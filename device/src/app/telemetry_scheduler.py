@@ -20,6 +20,10 @@ _MORSE = {
 }
 _MORSE_UNIT_MS = 50   # 1 unit = 50 ms  →  dot=50 ms, dash=150 ms
 
+# REPL logging for tick(). Set False to skip all debug formatting/printing
+# (repr(), value sampling) on the send path.
+DEBUG_LOG = True
+
 
 def _json():
     """Lazy JSON import (prefer ujson)."""
@@ -49,6 +53,7 @@ class TelemetryScheduler:
         self._next_send_ms = time.ticks_add(time.ticks_ms(), 30000)
         self._last_reading = None
 
+        self._dbg_enabled = bool(DEBUG_LOG)
         self._dbg_every_n = 1
         self._dbg_count = 0
 
@@ -307,8 +312,10 @@ class TelemetryScheduler:
 
         self._next_send_ms = time.ticks_add(now, interval_s * 1000)
 
-        self._dbg_count += 1
-        do_print = (self._dbg_count % int(self._dbg_every_n)) == 0
+        do_print = False
+        if self._dbg_enabled:
+            self._dbg_count += 1
+            do_print = (self._dbg_count % int(self._dbg_every_n)) == 0
         if do_print:
             self._dbg_print("telemetry: DUE interval_s=", interval_s)
 
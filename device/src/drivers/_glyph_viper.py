@@ -0,0 +1,39 @@
+# src/drivers/_glyph_viper.py
+# Viper glyph writer for ezFBfont (Pico / ESP32 MicroPython)
+#
+# font_to_py fonts are horizontally mapped (MONO_HLSB, MSB = leftmost
+# pixel); the SSD1306 buffer is MONO_VLSB (1 byte = 8 vertical pixels).
+# This copies one glyph cell straight into the display buffer, opaque
+# (fg=1 / bg=0), without building a FrameBuffer per character.
+#
+# Viper takes at most 4 positional args, so geometry is packed:
+#   wh  = glyph_w | (glyph_h << 8)
+#   pos = x | (y << 8) | (dst_width << 16)
+# The caller guarantees the cell is fully on-screen (no clipping here).
+
+import micropython
+
+
+@micropython.viper
+def blit_glyph_vlsb(dst: ptr8, glyph: ptr8, wh: int, pos: int):
+    gw = wh & 0xFF
+    gh = (wh >> 8) & 0xFF
+    x = pos & 0xFF
+    y = (pos >> 8) & 0xFF
+    dw = (pos >> 16) & 0xFFFF
+    gstride = (gw + 7) >> 3
+    gy = 0
+    while gy < gh:
+        yy = y + gy
+        row = (yy >> 3) * dw + x
+        bit = 1 << (yy & 7)
+        nbit = 0xFF ^ bit
+        src = gy * gstride
+        gx = 0
+        while gx < gw:
+            if glyph[src + (gx >> 3)] & (0x80 >> (gx & 7)):
+                dst[row + gx] = dst[row + gx] | bit
+            else:
+                dst[row + gx] = dst[row + gx] & nbit
+            gx += 1
+        gy += 1
@@ -1,10 +1,21 @@
 # ezFBfont.py — Safe Optimized Version
 # Based on original Peter Hinch writer adaptation
-# Only optimization: reuse palette buffer
+# Optimizations: reuse palette buffer; viper fast path for opaque
+# fg=1/bg=0 text into an SSD1306 (MONO_VLSB) buffer; per-writer
+# get_ch() cache.
 # Everything else behaves exactly like original.
 
 import framebuf
 
+# get_ch() results kept per writer. The UI draws a small, fixed
+# character set (digits, caps, a few symbols); printable ASCII fits.
+_CH_CACHE_MAX = 96
+
+try:
+    from src.drivers._glyph_viper import blit_glyph_vlsb
+except Exception:
+    blit_glyph_vlsb = None
+
 
 class ezFBfont:
 
@@ -34,6 +45,10 @@ class ezFBfont:
         self._font_height = self._font.height()
         self._font_baseline = self._font.baseline()
 
+        # char -> (glyph, height, width); font get_ch() slices two
+        # memoryviews per call, a dict hit allocates nothing
+        self._ch_cache = {}
+
         # SAFE OPTIMIZATION:
         # Reuse palette buffer instead of allocating every character
         self._palette_buf = bytearray(self._font_colors * 2)
@@ -49,6 +64,13 @@ class ezFBfont:
                          hgap, vgap,
                          split, verbose)
 
+        # Viper fast path target: the SSD1306 driver (MONO_VLSB .buffer,
+        # .pages). Checked by identity, so temporarily pointing _device at
+        # another FrameBuffer falls back to the blit path automatically.
+        self._vlsb_dev = None
+        if blit_glyph_vlsb is not None and hasattr(device, "buffer") and hasattr(device, "pages"):
+            self._vlsb_dev = device
+
     # -------------------------------------------------
     # Defaults (restored original behavior)
     # -------------------------------------------------
@@ -96,10 +118,20 @@ class ezFBfont:
     def _swap_bytes(self, color):
         return ((color & 255) << 8) + (color >> 8) if self._cswap else color
 
+    def _get_ch(self, char):
+        v = self._ch_cache.get(char)
+        if v is None:
+            cache = self._ch_cache
+            if len(cache) >= _CH_CACHE_MAX:
+                cache.clear()
+            v = self._font.get_ch(char)
+            cache[char] = v
+        return v
+
     def _line_size(self, string):
         x = 0
         for char in string:
-            _, _, char_width = self._font.get_ch(char)
+            _, _, char_width = self._get_ch(char)
             if char_width > 0:
                 x += char_width + self.hgap
         if x != 0:
@@ -112,10 +144,19 @@ class ezFBfont:
 
     def _put_char(self, char, x, y, fg, bg, tkey):
 
-        glyph, char_height, char_width = self._font.get_ch(char)
+        glyph, char_height, char_width = self._get_ch(char)
         if glyph is None:
             return None, None
 
+        dev = self._device
+        if (dev is self._vlsb_dev and fg == 1 and bg == 0 and tkey == -1
+                and x >= 0 and y >= 0
+                and x + char_width <= dev.width and y + char_height <= dev.height):
+            blit_glyph_vlsb(dev.buffer, glyph,
+                            char_width | (char_height << 8),
+                            x | (y << 8) | (dev.width << 16))
+            return char_width, char_height
+
         # ORIGINAL BEHAVIOR: ensure buffer protocol
         try:
             buf = bytearray(glyph)
@@ -13,6 +13,7 @@ class AirBuddyButton:
       - Single / double / triple / quad click
       - Debounced
       - Non-blocking poll_action()
+      - wait_ms(): idle between polls, woken early by a pin-edge IRQ
       - Optional LED while held
     """
 
@@ -61,6 +62,18 @@ class AirBuddyButton:
         self._click_count = 0
         self._click_window_start_ms = None
 
+        # Edge flag set from the pin IRQ, cleared by poll_action(). Lets
+        # wait_ms() sleep through idle time and still wake on a press.
+        self._edge = False
+        try:
+            self.pin.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._on_edge)
+            self._has_irq = True
+        except Exception:
+            self._has_irq = False
+
+    def _on_edge(self, pin):
+        self._edge = True
+
     # --------------------------------------------------
     # LED helper
     # --------------------------------------------------
@@ -84,6 +97,9 @@ class AirBuddyButton:
             "sleep", "single", "double", "triple", "quad", or None
         """
 
+        # Any edge up to here is seen by this sample
+        self._edge = False
+
         now = time.ticks_ms()
         level = self.pin.value()
 
@@ -146,6 +162,25 @@ class AirBuddyButton:
 
         return None
 
+    def wait_ms(self, ms, step_ms=25):
+        """
+        Sleep before the next poll_action(): up to ms, in step_ms chunks,
+        returning after the chunk in which a pin edge arrived. While a
+        press / debounce / click window is in progress (or without IRQ
+        support) it sleeps at most step_ms, so click timing is sampled
+        exactly as before.
+        """
+        if ms <= 0:
+            return
+        if (not self._has_irq or self._press_start_ms is not None or self._click_count
+                or self._last_level != self._stable_level):
+            time.sleep_ms(ms if ms < step_ms else step_ms)
+            return
+        while ms > 0 and not self._edge:
+            d = ms if ms < step_ms else step_ms
+            time.sleep_ms(d)
+            ms -= d
+
     def is_interacting(self):
         """True while a click sequence is in progress (button held or clicks pending)."""
         return self._press_start_ms is not None or self._click_count > 0
@@ -44,6 +44,17 @@ class Booter:
         self.bar = ThermoBar(oled)
         self._layout = None
 
+        # Logo: bind once (no per-frame getattr / isinstance / bytes() copy)
+        self._logo_w = int(getattr(logo_airbuddy, "WIDTH", 0))
+        self._logo_h = int(getattr(logo_airbuddy, "HEIGHT", 0))
+        data = getattr(logo_airbuddy, "DATA", None)
+        if data is not None and not isinstance(data, (bytes, bytearray)):
+            try:
+                data = bytes(data)
+            except Exception:
+                data = None
+        self._logo_mv = memoryview(data) if data is not None else None
+
         # footer truncation
         self._footer_max_chars = 26
 
@@ -113,19 +124,13 @@ class Booter:
         if not fb:
             return
 
-        lw = int(getattr(logo_airbuddy, "WIDTH", 0))
-        lh = int(getattr(logo_airbuddy, "HEIGHT", 0))
-        data = getattr(logo_airbuddy, "DATA", None)
+        lw = self._logo_w
+        lh = self._logo_h
+        data = self._logo_mv
 
         if (lw <= 0) or (lh <= 0) or (data is None):
             return
 
-        if not isinstance(data, (bytes, bytearray)):
-            try:
-                data = bytes(data)
-            except Exception:
-                return
-
         sw = int(getattr(self.oled, "width", 128))
         sh = int(getattr(self.oled, "height", 64))
 
@@ -154,8 +159,8 @@ class Booter:
         gap_logo_to_bar = 4
         gap_bar_to_footer = 4
 
-        lw = int(getattr(logo_airbuddy, "WIDTH", 0))
-        lh = int(getattr(logo_airbuddy, "HEIGHT", 0))
+        lw = self._logo_w
+        lh = self._logo_h
 
         bar_w = int(w * 0.70)
         if bar_w < 40:
@@ -188,6 +193,7 @@ class Booter:
             "bar_x": bar_x,
             "bar_y": bar_y,
             "bar_w": bar_w,
+            "bar_h": bar_h,
             "logo_y": logo_y,
             "footer_y": footer_y,
         }
@@ -227,6 +233,25 @@ class Booter:
 
         self._show_fb()
 
+    def _draw_bar_only(self, p=0.0):
+        """
+        Partial update: repaint just the progress bar rectangle and push.
+        Logo + footer are left as drawn by the previous full frame.
+        """
+        if self._layout is None:
+            self._draw_frame(p=p)
+            return
+
+        bar_x = self._layout["bar_x"]
+        bar_y = self._layout["bar_y"]
+        bar_w = self._layout["bar_w"]
+        bar_h = self._layout["bar_h"]
+
+        # ThermoBar clears its own rect (clear_bg=True) before drawing
+        self.bar.draw(bar_x, bar_y, bar_w, bar_h, p=max(0.0, min(1.0, float(p))))
+
+        self._show_fb()
+
     # -------------------------------------------------
     # Legacy warmup animation (used by src/app/main.py)
     # -------------------------------------------------
@@ -238,10 +263,16 @@ class Booter:
 
         self._draw_frame(p=0.0, footer=footer or self.version)
 
+        # Deadline-based pacing: frame work (I2C push, logo blit) eats into
+        # the frame period instead of adding to it, so duration stays honest.
+        t0 = time.ticks_ms()
         for i in range(frames + 1):
             p = i / float(frames)
             self._draw_frame(p=p, footer=footer)
-            time.sleep_ms(delay_ms)
+            deadline = time.ticks_add(t0, (i + 1) * delay_ms)
+            remaining = time.ticks_diff(deadline, time.ticks_ms())
+            if remaining > 0:
+                time.sleep_ms(remaining)
 
     # -------------------------------------------------
     # Boot pipeline
@@ -342,10 +373,14 @@ class Booter:
             if rf < 1:
                 rf = 1
 
+            footer = detail if detail else label
             for j in range(rf):
                 pj = p_prev + (p_next - p_prev) * ((j + 1) / float(rf))
-                footer = detail if detail else label
-                self._draw_frame(p=pj, footer=footer)
+                if footer == label:
+                    # Logo + footer unchanged since the pre-step frame
+                    self._draw_bar_only(p=pj)
+                else:
+                    self._draw_frame(p=pj, footer=footer)
                 time.sleep_ms(int(1000 / max(1, int(fps))))
 
             status = "OK" if ok else "FAIL"
@@ -18,6 +18,46 @@ def gc_collect():
         pass
 
 
+# gc_maybe(): heap use right after our last collect, and the triggers
+_GC_LAST_ALLOC = 0
+GC_GROWTH_BYTES = 4096
+GC_MIN_FREE = 8192
+
+
+def gc_maybe():
+    """
+    Collect only if the heap grew by GC_GROWTH_BYTES since the last
+    gc_maybe() collect, or free RAM is below GC_MIN_FREE. For per-render
+    call sites, where an unconditional gc.collect() rescans the whole heap
+    even when a frame allocated next to nothing.
+    """
+    global _GC_LAST_ALLOC
+    try:
+        import gc
+        if gc.mem_alloc() - _GC_LAST_ALLOC > GC_GROWTH_BYTES or gc.mem_free() < GC_MIN_FREE:
+            gc.collect()
+            _GC_LAST_ALLOC = gc.mem_alloc()
+    except Exception:
+        pass
+
+
+def idle_wait(btn, ms, poll_ms=WAIT_POLL_MS):
+    """
+    Sleep between polls of a show_live() loop. ms is how long until the
+    loop next has work of its own (tick, animation, deadline). Buttons
+    with wait_ms() sleep that long unless pressed, others keep the fixed
+    poll_ms cadence.
+    """
+    w = getattr(btn, "wait_ms", None)
+    if w is None:
+        time.sleep_ms(int(poll_ms))
+        return
+    try:
+        w(int(ms), int(poll_ms))
+    except Exception:
+        time.sleep_ms(int(poll_ms))
+
+
 def flush_actions(btn, ms=250, poll_ms=WAIT_POLL_MS):
     """
     Drain any queued click actions for up to ms.
@@ -22,8 +22,17 @@
 #        value when the caller passes api_connected=None (the default).
 #        Callers that pass an explicit True/False still override the cache for
 #        that call (and update the cache so later draw() calls stay in sync).
+#
+# Strip cache
+# -----------
+# The three icons only have 3 x 2 x 2 visual states, so the whole cluster is
+# composed once per (gps_state, wifi, api_filled, gap) into a small offscreen
+# FrameBuffer and pushed with a single opaque blit (clears + draws in one C
+# call, gap columns included).
+
+import framebuf
 
-from src.ui.glyphs import draw_wifi, draw_gps, draw_api
+from src.ui.glyphs import draw_wifi, draw_gps, draw_api, api_heartbeat_filled
 from src.ui.glyphs import GPS_NONE, GPS_INIT, GPS_FIXED  # noqa: F401 — re-exported
 
 # Icon pixel dimensions (callers may import for layout math)
@@ -52,6 +61,22 @@ def set_api_ok(ok):
     _api_ok = bool(ok)
 
 
+_STRIP_CACHE = {}
+
+
+def _strip(gps_state, wifi_on, api_filled, gap):
+    key = (gps_state, wifi_on, api_filled, gap)
+    sfb = _STRIP_CACHE.get(key)
+    if sfb is None:
+        w = GPS_W + gap + API_W + gap + WIFI_W
+        sfb = framebuf.FrameBuffer(bytearray(((w + 7) // 8) * HEIGHT), w, HEIGHT, framebuf.MONO_HLSB)
+        draw_gps(sfb, 0, 0, state=gps_state, color=1)
+        draw_api(sfb, GPS_W + gap, 0, on=api_filled, color=1)
+        draw_wifi(sfb, w - WIFI_W, 0, on=wifi_on, color=1)
+        _STRIP_CACHE[key] = sfb
+    return sfb
+
+
 def _probe_wifi():
     """
     Live WiFi check via MicroPython network module.
@@ -107,31 +132,13 @@ def draw(
     else:
         api_actual = bool(api_connected)
 
-    w = int(oled_width)
-    y = int(icon_y)
     g = int(gap)
-    x = w - int(right_inset)
-
-    # WiFi (rightmost)
-    x -= WIFI_W
-    fb.fill_rect(x, y, WIFI_W, WIFI_H, 0)
-    draw_wifi(fb, x, y, on=wifi_actual, color=1)
-    x -= g
-
-    # API
-    x -= API_W
-    fb.fill_rect(x, y, API_W, API_H, 0)
-    draw_api(
-        fb, x, y,
-        on=bool(api_actual),
-        heartbeat=bool(api_actual),
-        sending=bool(api_sending),
-        color=1,
-        now_ms=now_ms,
-    )
-    x -= g
-
-    # GPS (leftmost in cluster)
-    x -= GPS_W
-    fb.fill_rect(x, y, GPS_W, GPS_H, 0)
-    draw_gps(fb, x, y, state=int(gps_state), color=1)
+
+    # API — heartbeat phase resolved once here; the strip just picks the glyph
+    api_filled = bool(api_actual) and api_heartbeat_filled(now_ms=now_ms, sending=bool(api_sending))
+
+    # Right-to-left: WiFi (rightmost) — gap — API — gap — GPS
+    sfb = _strip(int(gps_state), bool(wifi_actual), bool(api_filled), g)
+    w = GPS_W + g + API_W + g + WIFI_W
+    x = int(oled_width) - int(right_inset) - w
+    fb.blit(sfb, x, int(icon_y))
@@ -1,5 +1,9 @@
 # src/ui/faces.py — Reusable OLED face drawing (Pico / MicroPython safe)
 
+import framebuf
+import micropython
+
+
 def _in_bounds(w, h, x, y):
     return 0 <= x < w and 0 <= y < h
 
@@ -9,6 +13,7 @@ def _pix(fb, w, h, x, y, c=1):
         fb.pixel(x, y, c)
 
 
+@micropython.native
 def _hline(fb, w, h, x, y, length, c=1):
     if y < 0 or y >= h:
         return
@@ -18,6 +23,7 @@ def _hline(fb, w, h, x, y, length, c=1):
         fb.pixel(xx, y, c)
 
 
+@micropython.native
 def _vline(fb, w, h, x, y, length, c=1):
     if x < 0 or x >= w:
         return
@@ -27,37 +33,21 @@ def _vline(fb, w, h, x, y, length, c=1):
         fb.pixel(x, yy, c)
 
 
-def _line(fb, w, h, x0, y0, x1, y1, c=1):
-    # Bresenham
-    dx = abs(x1 - x0)
-    sx = 1 if x0 < x1 else -1
-    dy = -abs(y1 - y0)
-    sy = 1 if y0 < y1 else -1
-    err = dx + dy
-    while True:
-        _pix(fb, w, h, x0, y0, c)
-        if x0 == x1 and y0 == y1:
-            break
-        e2 = 2 * err
-        if e2 >= dy:
-            err += dy
-            x0 += sx
-        if e2 <= dx:
-            err += dx
-            y0 += sy
-
-
 def _thick_line(fb, w, h, x0, y0, x1, y1, thickness=2, c=1):
-    _line(fb, w, h, x0, y0, x1, y1, c)
+    # framebuf.line() clips per pixel in C; no Python Bresenham needed
+    line = fb.line
+    line(x0, y0, x1, y1, c)
     if thickness <= 1:
         return
-    _line(fb, w, h, x0 + 1, y0, x1 + 1, y1, c)
-    _line(fb, w, h, x0 - 1, y0, x1 - 1, y1, c)
-    _line(fb, w, h, x0, y0 + 1, x1, y1 + 1, c)
-    _line(fb, w, h, x0, y0 - 1, x1, y1 - 1, c)
+    line(x0 + 1, y0, x1 + 1, y1, c)
+    line(x0 - 1, y0, x1 - 1, y1, c)
+    line(x0, y0 + 1, x1, y1 + 1, c)
+    line(x0, y0 - 1, x1, y1 - 1, c)
 
 
+@micropython.native
 def _circle_outline(fb, w, h, cx, cy, r, c=1):
+    # Fallback for framebuf builds without ellipse() (before MicroPython 1.20)
     x = r
     y = 0
     err = 0
@@ -66,7 +56,10 @@ def _circle_outline(fb, w, h, cx, cy, r, c=1):
                 ( x,  y), ( y,  x), (-y,  x), (-x,  y),
                 (-x, -y), (-y, -x), ( y, -x), ( x, -y)
         ):
-            _pix(fb, w, h, cx + dx, cy + dy, c)
+            px = cx + dx
+            py = cy + dy
+            if 0 <= px < w and 0 <= py < h:
+                fb.pixel(px, py, c)
         y += 1
         err += 1 + 2 * y
         if 2 * (err - x) + 1 > 0:
@@ -75,10 +68,17 @@ def _circle_outline(fb, w, h, cx, cy, r, c=1):
 
 
 def draw_thick_circle(fb, w, h, cx, cy, r, thickness=3, c=1):
+    try:
+        ellipse = fb.ellipse
+    except AttributeError:
+        ellipse = None
     for i in range(thickness):
         rr = r - i
         if rr > 0:
-            _circle_outline(fb, w, h, cx, cy, rr, c)
+            if ellipse is not None:
+                ellipse(cx, cy, rr, rr, c)
+            else:
+                _circle_outline(fb, w, h, cx, cy, rr, c)
 
 
 def _dot_eye(fb, w, h, cx, cy, size=3, c=1):
@@ -86,20 +86,77 @@ def _dot_eye(fb, w, h, cx, cy, size=3, c=1):
     fb.fill_rect(cx - s, cy - s, 2 * s + 1, 2 * s + 1, c)
 
 
-def _x_eye(fb, w, h, cx, cy, size=3, thick=2, c=1):
-    s = size
+def _x_eye_lines(fb, w, h, cx, cy, s, thick, c):
     _thick_line(fb, w, h, cx - s, cy - s, cx + s, cy + s, thick, c)
     _thick_line(fb, w, h, cx - s, cy + s, cx + s, cy - s, thick, c)
 
 
-def _star_eye(fb, w, h, cx, cy, size=3, thick=2, c=1):
-    s = size
+def _star_eye_lines(fb, w, h, cx, cy, s, thick, c):
     _thick_line(fb, w, h, cx - s, cy, cx + s, cy, thick, c)
     _thick_line(fb, w, h, cx, cy - s, cx, cy + s, thick, c)
     _thick_line(fb, w, h, cx - s, cy - s, cx + s, cy + s, thick, c)
     _thick_line(fb, w, h, cx - s, cy + s, cx + s, cy - s, thick, c)
 
 
+# ------------------------------------------------------------
+# Eye tile cache
+# X / star eyes are the same shape every time, so render each
+# (kind, size, thick) once into a tiny MONO_HLSB tile and blit it.
+# ------------------------------------------------------------
+_EYE_CACHE = {}
+
+
+def _eye_tile(kind, size, thick):
+    key = (kind, size, thick)
+    tile = _EYE_CACHE.get(key)
+    if tile is None:
+        r = size + 1            # thick lines spill 1px past the endpoints
+        n = 2 * r + 1
+        buf = bytearray(((n + 7) // 8) * n)
+        tfb = framebuf.FrameBuffer(buf, n, n, framebuf.MONO_HLSB)
+        if kind == "x":
+            _x_eye_lines(tfb, n, n, r, r, size, thick, 1)
+        else:
+            _star_eye_lines(tfb, n, n, r, r, size, thick, 1)
+        tile = (tfb, r)
+        _EYE_CACHE[key] = tile
+    return tile
+
+
+def _x_eye(fb, w, h, cx, cy, size=3, thick=2, c=1):
+    if c != 1:
+        _x_eye_lines(fb, w, h, cx, cy, size, thick, c)
+        return
+    tfb, r = _eye_tile("x", size, thick)
+    fb.blit(tfb, cx - r, cy - r, 0)
+
+
+def _star_eye(fb, w, h, cx, cy, size=3, thick=2, c=1):
+    if c != 1:
+        _star_eye_lines(fb, w, h, cx, cy, size, thick, c)
+        return
+    tfb, r = _eye_tile("star", size, thick)
+    fb.blit(tfb, cx - r, cy - r, 0)
+
+
+# ------------------------------------------------------------
+# Mouth curve cache
+# Parabola offsets (dx*dx*num) // den for dx in -half..half. A face
+# only ever uses a handful of (half, num, den) shapes, so each is
+# computed once instead of per pixel on every draw.
+# ------------------------------------------------------------
+_CURVE_CACHE = {}
+
+
+def _curve(half, num, den):
+    key = (half, num, den)
+    offs = _CURVE_CACHE.get(key)
+    if offs is None:
+        offs = tuple((dx * dx * num) // den for dx in range(-half, half + 1))
+        _CURVE_CACHE[key] = offs
+    return offs
+
+
 # ------------------------------------------------------------
 # Circular arc mouth (clean OLED look)
 # ------------------------------------------------------------
@@ -113,11 +170,12 @@ def _mouth_arc(fb, w, h, cx, cy, radius, angle_span_deg=40, facing="up", thick=2
     half_span = max(8, int(radius * 0.75))
     sag = max(3, int(radius * 0.22))
 
-    for dx in range(-half_span, half_span + 1):
-        y_off = int((dx * dx) * sag / max(1, (half_span * half_span)))
-
+    up = facing == "up"
+    t0 = -(thick // 2)
+    x = cx - half_span
+    for y_off in _curve(half_span, sag, half_span * half_span):
         # NOTE: OLED coordinates: larger y is lower on screen.
-        if facing == "up":
+        if up:
             # ✅ SMILE: center lowest (largest y)
             yy = cy + sag - y_off
         else:
@@ -125,7 +183,8 @@ def _mouth_arc(fb, w, h, cx, cy, radius, angle_span_deg=40, facing="up", thick=2
             yy = cy - sag + y_off
 
         for t in range(thick):
-            _pix(fb, w, h, cx + dx, yy + t - (thick // 2), c)
+            _pix(fb, w, h, x, yy + t + t0, c)
+        x += 1
 
 
 def _mouth_flat(fb, w, h, cx, cy, w_half, thick=2, c=1):
@@ -140,14 +199,15 @@ def _mouth_worried(fb, w, h, cx, cy, w_half, thick=2, c=1):
 
 def _mouth_frown_legacy(fb, w, h, cx, cy, w_half, curve, thick=2, c=1):
     # Keep for VERYBAD as requested
-    for dx in range(-w_half, w_half + 1):
-        y = int((dx * dx) / max(1, curve))
+    x = cx - w_half
+    for y in _curve(w_half, 1, max(1, curve)):
         yy = cy + y
-        _pix(fb, w, h, cx + dx, yy, c)
+        _pix(fb, w, h, x, yy, c)
         if thick >= 2:
-            _pix(fb, w, h, cx + dx, yy - 1, c)
+            _pix(fb, w, h, x, yy - 1, c)
         if thick >= 3:
-            _pix(fb, w, h, cx + dx, yy + 1, c)
+            _pix(fb, w, h, x, yy + 1, c)
+        x += 1
 
 
 # ------------------------------------------------------------
@@ -615,38 +615,43 @@ def sleep_flow(btn, oled, get_screen, flush_ms=250, poll_ms=25, tick_fn=None):
 # ============================================================
 # SELF DESTRUCT (QUAD CLICK)
 # ============================================================
-def selfdestruct_flow(btn, oled, get_screen, flush_ms=250, poll_ms=25, tick_fn=None):
+def _resolve_selfdestruct(get_screen):
+    # (bound method, passes_btn) or None. Looked up on every quad click, not
+    # cached: main clears the screen cache before this flow, and a cached
+    # method would keep the old instance (and its buffers) alive.
     scr = get_screen("selfdestruct")
+    if not scr:
+        return None
+    # Preferred: show_live(btn) -> show(btn) -> legacy run()
+    fn = getattr(scr, "show_live", None)
+    if fn is None:
+        fn = getattr(scr, "show", None)
+    if fn is not None:
+        return fn, True
+    fn = getattr(scr, "run", None)
+    if fn is not None:
+        return fn, False
+    return None
 
-    if scr:
-        # Preferred: show_live(btn)
-        if hasattr(scr, "show_live"):
-            try:
-                scr.show_live(btn)
-            except TypeError:
-                try:
-                    scr.show_live(btn=btn)
-                except Exception:
-                    pass
-            except Exception:
-                pass
 
-        # Next: show(btn)
-        elif hasattr(scr, "show"):
+def selfdestruct_flow(btn, oled, get_screen, flush_ms=250, poll_ms=25, tick_fn=None):
+    runner = _resolve_selfdestruct(get_screen)
+
+    if runner is not None:
+        fn, passes_btn = runner
+        if passes_btn:
             try:
-                scr.show(btn)
+                fn(btn)
             except TypeError:
                 try:
-                    scr.show(btn=btn)
+                    fn(btn=btn)
                 except Exception:
                     pass
             except Exception:
                 pass
-
-        # Legacy: run()
-        elif hasattr(scr, "run"):
+        else:
             try:
-                scr.run()
+                fn()
             except Exception:
                 pass
     else:
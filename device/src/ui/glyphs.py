@@ -1,158 +1,371 @@
 # src/ui/glyphs.py — tiny pixel glyphs for SSD1306/framebuf
 # Pico / MicroPython safe
 
-import time
+import framebuf
+import micropython
+from array import array
 
 # ------------------------------------------------------------
 # Low-level helpers
 # ------------------------------------------------------------
 
+# Capability detection: resolve fb's primitives once per framebuffer
+# instead of wrapping every pixel write in try/except. Missing
+# hline/vline/fill_rect get pixel-loop fallbacks.
+_BOUND = [None, None]   # [last fb, (pixel, hline, vline, fill_rect)]
+
+
+def _bind(fb):
+    b = _BOUND
+    if b[0] is fb:
+        return b[1]
+
+    pixel = fb.pixel
+
+    hline = getattr(fb, "hline", None)
+    if hline is None:
+        def hline(x, y, w, c):
+            for i in range(w):
+                pixel(x + i, y, c)
+
+    vline = getattr(fb, "vline", None)
+    if vline is None:
+        def vline(x, y, h, c):
+            for i in range(h):
+                pixel(x, y + i, c)
+
+    fill_rect = getattr(fb, "fill_rect", None)
+    if fill_rect is None:
+        def fill_rect(x, y, w, h, c):
+            for yy in range(h):
+                hline(x, y + yy, w, c)
+
+    prims = (pixel, hline, vline, fill_rect)
+    b[0] = fb
+    b[1] = prims
+    return prims
+
+
+# Defensive wrappers (coerce to int) for callers outside this module.
+# Internal draw paths take ints from the UI screens and skip the int()
+# dispatch: _pix_i / the bound primitives directly.
 def _pix(fb, x, y, c=1):
-    try:
-        fb.pixel(int(x), int(y), int(c))
-    except Exception:
-        pass
+    _bind(fb)[0](int(x), int(y), int(c))
+
+
+def _pix_i(fb, x, y, c):
+    _bind(fb)[0](x, y, c)
 
 
 def _hline(fb, x, y, w, c=1):
-    try:
-        fb.hline(int(x), int(y), int(w), int(c))
-    except Exception:
-        for i in range(int(w)):
-            _pix(fb, x + i, y, c)
+    _bind(fb)[1](int(x), int(y), int(w), int(c))
 
 
 def _vline(fb, x, y, h, c=1):
-    try:
-        fb.vline(int(x), int(y), int(h), int(c))
-    except Exception:
-        for i in range(int(h)):
-            _pix(fb, x, y + i, c)
+    _bind(fb)[2](int(x), int(y), int(h), int(c))
 
 
 def _fill_rect(fb, x, y, w, h, c=1):
-    try:
-        fb.fill_rect(int(x), int(y), int(w), int(h), int(c))
-    except Exception:
-        for yy in range(int(h)):
-            _hline(fb, x, y + yy, w, c)
+    _bind(fb)[3](int(x), int(y), int(w), int(h), int(c))
 
 
-def draw_bitmap_rows(fb, x, y, rows, c=1):
+def _bits(rows):
+    """
+    '0'/'1' strings -> tuple of bytes rows holding raw 0/1 values.
+    The glyph tables stay readable in source and are converted once at
+    import, so row scans test a byte (`if row[i]:`) instead of a 1-char
+    string compare. bytes rows pass through unchanged.
+    """
+    out = []
+    for row in rows:
+        if isinstance(row, str):
+            row = bytes([1 if ch == "1" else 0 for ch in row])
+        out.append(row)
+    return tuple(out)
+
+
+# ------------------------------------------------------------
+# Per-slot redraw dedupe
+#
+# Skip a glyph draw when the same glyph/state was already drawn at the
+# same spot on the same framebuffer since the last full clear. Only
+# framebuffers exposing a `gen` counter (SSD1306_I2C bumps it on fill())
+# take part; offscreen tiles never skip. Only the face9 and header
+# (wifi/gps/api) slots dedupe, and none of the partial fill_rect erases
+# (summary heartbeat, online status row, self-destruct bands, spinner
+# band) overlaps them; a new partial erase that does must fill() instead.
+# ------------------------------------------------------------
+
+_LAST_DRAWN = {}
+_LAST_GEN = [None]
+
+
+def _unchanged(fb, slot, x, y, state):
+    gen = getattr(fb, "gen", None)
+    if gen is None:
+        return False
+    if gen != _LAST_GEN[0]:
+        _LAST_DRAWN.clear()
+        _LAST_GEN[0] = gen
+    key = (id(fb), slot, x, y)
+    if _LAST_DRAWN.get(key) == state:
+        return True
+    _LAST_DRAWN[key] = state
+    return False
+
+
+# Debug-only guard for the int-typed draw_* API (coords are no longer
+# coerced with int()); asserts are stripped by mpy-cross -O.
+_XY_MSG = "glyph coords must be int"
+
+
+def _row_runs(rows):
     """
-    rows: list[str] of '0'/'1' where each string is a row of pixels.
-    Top-left at (x, y).
+    Horizontal runs of lit pixels as (ry, rx, length) tuples.
+    One hline() per run replaces one pixel() per lit pixel.
     """
-    x = int(x)
-    y = int(y)
+    runs = []
+    for ry, row in enumerate(_bits(rows)):
+        n = len(row)
+        i = 0
+        while i < n:
+            if row[i]:
+                j = i
+                while j < n and row[j]:
+                    j += 1
+                runs.append((ry, i, j - i))
+                i = j
+            else:
+                i += 1
+    return tuple(runs)
+
+
+# Run tables for the module's own glyph rows, keyed by id(rows).
+# Only filled by _compile() for module-level tables, which live forever.
+_RUNS = {}
+
+
+def _compile(rows):
+    """
+    Pre-render list[str] rows into a MONO_HLSB FrameBuffer once (import time).
+    Drawing is then a single native fb.blit(gfb, x, y, 0) instead of a
+    per-pixel loop (key=0: unset glyph pixels stay transparent).
+    Also caches the row runs for the non-blit fallback paths.
+    """
+    _RUNS[id(rows)] = _row_runs(rows)
+    h = len(rows)
+    w = len(rows[0]) if h else 0
+    gfb = framebuf.FrameBuffer(bytearray(((w + 7) // 8) * h), w, h, framebuf.MONO_HLSB)
     for ry, row in enumerate(rows):
-        for rx, ch in enumerate(row):
-            if ch == "1":
-                _pix(fb, x + rx, y + ry, c)
+        for rx in range(w):
+            if row[rx]:
+                gfb.pixel(rx, ry, 1)
+    return gfb
+
+
+@micropython.native
+def draw_bitmap_rows(fb, x, y, rows, c=1):
+    """
+    rows: list[str] of '0'/'1' (or bytes of 0/1) where each entry is a row of pixels.
+    Top-left at (x, y). Emits one hline per horizontal run of '1'.
+    """
+    runs = _RUNS.get(id(rows))
+    if runs is None:
+        runs = _row_runs(rows)
+    hline = _bind(fb)[1]
+    for ry, rx, n in runs:
+        hline(x + rx, y + ry, n, c)
+
+
+@micropython.native
+def _draw_scaled(fb, x, y, rows, scale, c=1):
+    """
+    Scaled / non-blit glyph path: one fill_rect per horizontal run of
+    lit pixels (run_len*scale wide, scale tall) instead of one per pixel.
+    """
+    runs = _RUNS.get(id(rows))
+    if runs is None:
+        runs = _row_runs(rows)
+    fill_rect = _bind(fb)[3]
+    for ry, rx, n in runs:
+        fill_rect(x + rx * scale, y + ry * scale, n * scale, scale, c)
+
+
+# ------------------------------------------------------------
+# Symmetric offset tables for the small rings (built once per radius)
+# ------------------------------------------------------------
+
+_RING_OFFSETS = {}
+
+
+def _ring_offsets(kind, r):
+    """
+    Expand the first-octant points for `kind` ("degree" / "circle") at
+    radius r through the 8 symmetries, dedupe, and cache as a tuple of
+    (dx, dy) offsets from the centre.
+    """
+    key = (kind, r)
+    offs = _RING_OFFSETS.get(key)
+    if offs is not None:
+        return offs
+
+    if kind == "degree":
+        pts = ((0, r), (1, r), (2, r - 1))
+    else:
+        pts = ((0, r), (1, r), (2, r - 1), (3, r - 2))
+
+    seen = set()
+    for dx, dy in pts:
+        for sx, sy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+            seen.add((sx * dx, sy * dy))
+            seen.add((sx * dy, sy * dx))
+
+    offs = tuple(sorted(seen))
+    _RING_OFFSETS[key] = offs
+    return offs
+
+
+def _ring_tile(kind, r, filled=False):
+    """
+    Specialise one (kind, radius) ring into a blit tile: (fb, m) where m is
+    the half-extent, so the tile's top-left goes at (cx - m, cy - m).
+    filled bakes in draw_circle()'s 3x3 centre.
+    """
+    offs = _ring_offsets(kind, r)
+    m = 0
+    for dx, dy in offs:
+        m = max(m, abs(dx), abs(dy))
+    n = 2 * m + 1
+    tfb = framebuf.FrameBuffer(bytearray(((n + 7) // 8) * n), n, n, framebuf.MONO_HLSB)
+    for dx, dy in offs:
+        tfb.pixel(m + dx, m + dy, 1)
+    if filled:
+        tfb.fill_rect(m - 1, m - 1, 3, 3, 1)
+    return tfb, m
+
+
+# Radii the screens actually use: degree r=2 (temp/summary), circle r=2..4
+# (summary dots), filled circle r=4 (summary heartbeat). Anything else
+# takes the generic offset loop.
+_RING_TILES = {
+    ("degree", 2): _ring_tile("degree", 2),
+    ("circle", 2): _ring_tile("circle", 2),
+    ("circle", 3): _ring_tile("circle", 3),
+    ("circle", 4): _ring_tile("circle", 4),
+    ("dot", 4): _ring_tile("circle", 4, True),
+}
 
 
 # ------------------------------------------------------------
 # Degree ring (pixel)
 # ------------------------------------------------------------
 
+@micropython.native
 def draw_degree(fb, x, y, r=2, color=1):
     """
     Small hollow degree ring.
     (x, y) is top-left-ish anchor used in your screens.
     """
-    x = int(x)
-    y = int(y)
-    r = int(r)
     cx = x + r
     cy = y + r
+    assert type(x) is int and type(y) is int, _XY_MSG
 
-    pts = [
-        (0, r), (1, r), (2, r - 1),
-        (r, 0), (r, 1), (r - 1, 2),
-    ]
-    for dx, dy in pts:
-        for sx, sy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
-            _pix(fb, cx + sx * dx, cy + sy * dy, color)
-            _pix(fb, cx + sx * dy, cy + sy * dx, color)
+    tile = _RING_TILES.get(("degree", r)) if color == 1 else None
+    if tile is not None:
+        fb.blit(tile[0], cx - tile[1], cy - tile[1], 0)
+        return
+
+    pixel = _bind(fb)[0]
+    for dx, dy in _ring_offsets("degree", r):
+        pixel(cx + dx, cy + dy, color)
 
 
 # ------------------------------------------------------------
 # Circle (pixel) — used across screens
 # ------------------------------------------------------------
 
+@micropython.native
 def draw_circle(fb, cx, cy, r=4, filled=False, color=1):
     """
     Draws a small circle. If filled=True, draws a simple filled center.
     """
-    cx = int(cx)
-    cy = int(cy)
-    r = int(r)
+    assert type(cx) is int and type(cy) is int, _XY_MSG
 
-    pts = [
-        (0, r), (1, r), (2, r - 1), (3, r - 2),
-        (r, 0), (r, 1), (r - 1, 2), (r - 2, 3),
-    ]
-    for dx, dy in pts:
-        for sx, sy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
-            _pix(fb, cx + sx * dx, cy + sy * dy, color)
-            _pix(fb, cx + sx * dy, cy + sy * dx, color)
+    tile = _RING_TILES.get(("dot" if filled else "circle", r)) if color == 1 else None
+    if tile is not None:
+        fb.blit(tile[0], cx - tile[1], cy - tile[1], 0)
+        return
+
+    pixel = _bind(fb)[0]
+    for dx, dy in _ring_offsets("circle", r):
+        pixel(cx + dx, cy + dy, color)
 
     if filled:
-        _fill_rect(fb, cx - 1, cy - 1, 3, 3, color)
+        _bind(fb)[3](cx - 1, cy - 1, 3, 3, color)
 
 
 # ------------------------------------------------------------
 # Pixel "C" glyph (for LARGE temp units)
 # ------------------------------------------------------------
 
+_C_9 = [
+    "0111110",
+    "1100011",
+    "1100000",
+    "1100000",
+    "1100000",
+    "1100000",
+    "1100011",
+    "0111110",
+    "0000000",
+]
+
+_C_9 = _bits(_C_9)
+_C_FB = _compile(_C_9)
+
+
 def draw_c(fb, x, y, scale=1, color=1):
     """
     Draw a pixel 'C' glyph. Default is 7x9 at scale=1.
     """
-    rows = [
-        "0111110",
-        "1100011",
-        "1100000",
-        "1100000",
-        "1100000",
-        "1100000",
-        "1100011",
-        "0111110",
-        "0000000",
-    ]
-
-    x = int(x)
-    y = int(y)
-    scale = max(1, int(scale))
-    for ry, row in enumerate(rows):
-        for rx, ch in enumerate(row):
-            if ch == "1":
-                _fill_rect(fb, x + rx * scale, y + ry * scale, scale, scale, color)
+    if scale < 1:
+        scale = 1
+    assert type(x) is int and type(y) is int, _XY_MSG
+    if scale == 1 and color == 1:
+        fb.blit(_C_FB, x, y, 0)
+        return
+
+    _draw_scaled(fb, x, y, _C_9, scale, color)
 
 
 # ------------------------------------------------------------
 # Subscript "2" glyph (₂) for CO₂ in MED
 # ------------------------------------------------------------
 
+_SUB2_5 = [
+    "1110",
+    "0010",
+    "1110",
+    "1000",
+    "1110",
+]
+
+_SUB2_5 = _bits(_SUB2_5)
+_SUB2_FB = _compile(_SUB2_5)
+
+
 def draw_sub2(fb, x, y, scale=1, color=1):
     """
     Draw a small subscript '2' glyph. Default size 4x5 (scale=1).
     """
-    rows = [
-        "1110",
-        "0010",
-        "1110",
-        "1000",
-        "1110",
-    ]
-
-    x = int(x)
-    y = int(y)
-    scale = max(1, int(scale))
-    for ry, row in enumerate(rows):
-        for rx, ch in enumerate(row):
-            if ch == "1":
-                _fill_rect(fb, x + rx * scale, y + ry * scale, scale, scale, color)
+    if scale < 1:
+        scale = 1
+    assert type(x) is int and type(y) is int, _XY_MSG
+    if scale == 1 and color == 1:
+        fb.blit(_SUB2_FB, x, y, 0)
+        return
+
+    _draw_scaled(fb, x, y, _SUB2_5, scale, color)
 
 
 # ------------------------------------------------------------
@@ -221,20 +434,100 @@ _FACE_9PX = {
 }
 
 
+_FACE_9PX = {k: _bits(v) for k, v in _FACE_9PX.items()}
+_FACE_9PX_FB = {k: _compile(v) for k, v in _FACE_9PX.items()}
+
+# Mood handles: the compiled glyph itself. Pass these to draw_face9()
+# to skip the str()/lower()/name lookup on every frame.
+MOOD_GOOD = _FACE_9PX_FB["good"]
+MOOD_OK = _FACE_9PX_FB["ok"]
+MOOD_POOR = _FACE_9PX_FB["poor"]
+MOOD_BAD = _FACE_9PX_FB["bad"]
+MOOD_VERYBAD = _FACE_9PX_FB["verybad"]
+
+FACE_W = 11
+FACE_H = 9
+
+
+def _row_bits(rows):
+    """One uint16 per row, bit (FACE_W-1) = leftmost pixel."""
+    out = array("H")
+    for row in rows:
+        v = 0
+        for b in row:
+            v = (v << 1) | (1 if b else 0)
+        out.append(v)
+    return out
+
+
+# id(handle) -> (glyph fb, rows, packed row bits); handles live for the module lifetime
+_FACE_HANDLES = {id(v): (v, _FACE_9PX[k], _row_bits(_FACE_9PX[k])) for k, v in _FACE_9PX_FB.items()}
+
+
+@micropython.viper
+def _face_or_vlsb(buf: ptr8, bits: ptr16, geom: int, stride: int):
+    # OR an 11x9 face straight into a page-packed MONO_VLSB buffer.
+    # geom = x | (y << 8); caller guarantees the glyph is fully on-screen.
+    x = geom & 0xFF
+    y = geom >> 8
+    iy = 0
+    while iy < 9:
+        yy = y + iy
+        row = bits[iy]
+        base = (yy >> 3) * stride + x
+        mask = 1 << (yy & 7)
+        ib = 0
+        while ib < 11:
+            if row & (1 << (10 - ib)):
+                buf[base + ib] = buf[base + ib] | mask
+            ib += 1
+        iy += 1
+
+
+def _face_direct(fb, x, y, bits):
+    """
+    Fast path for the SSD1306 driver (exposes its VLSB .buffer): one viper
+    call writes the face bytes directly. Returns False when the target is
+    not a page buffer or the glyph would clip, so the caller blits instead.
+    """
+    buf = getattr(fb, "buffer", None)
+    if buf is None or getattr(fb, "pages", None) is None:
+        return False
+    w = fb.width
+    if x < 0 or y < 0 or x + FACE_W > w or y + FACE_H > fb.height:
+        return False
+    _face_or_vlsb(buf, bits, x | (y << 8), w)
+    return True
+
+
+def _face_by_name(mood):
+    gfb = _FACE_9PX_FB.get(str(mood).lower())
+    if gfb is None:
+        gfb = MOOD_OK
+    return _FACE_HANDLES[id(gfb)]
+
+
 def draw_face9(fb, x, y, mood="ok", scale=1, color=1):
     """
     Draw one of the 9px face glyphs at (x, y).
-    mood: "good", "ok", "poor", "bad", "verybad"
+    mood: MOOD_* handle (fast path) or "good", "ok", "poor", "bad", "verybad"
     """
-    rows = _FACE_9PX.get(str(mood).lower(), _FACE_9PX["ok"])
+    face = _FACE_HANDLES.get(id(mood))
+    if face is None:
+        face = _face_by_name(mood)
+    gfb, rows, bits = face
 
-    x = int(x)
-    y = int(y)
-    scale = max(1, int(scale))
-    for ry, row in enumerate(rows):
-        for rx, ch in enumerate(row):
-            if ch == "1":
-                _fill_rect(fb, x + rx * scale, y + ry * scale, scale, scale, color)
+    if scale < 1:
+        scale = 1
+    if _unchanged(fb, "face9", x, y, (id(gfb), scale, color)):
+        return
+    assert type(x) is int and type(y) is int, _XY_MSG
+    if scale == 1 and color == 1:
+        if not _face_direct(fb, x, y, bits):
+            fb.blit(gfb, x, y, 0)
+        return
+
+    _draw_scaled(fb, x, y, rows, scale, color)
 
 
 # ------------------------------------------------------------
@@ -261,6 +554,9 @@ _CLOCK_9 = [
     "000111000",  # row 8  bottom arc
 ]
 
+_CLOCK_9 = _bits(_CLOCK_9)
+_CLOCK_FB = _compile(_CLOCK_9)
+
 
 def draw_clock(fb, x, y, color=1):
     """
@@ -268,7 +564,11 @@ def draw_clock(fb, x, y, color=1):
     Hour hand points to 12; minute hand points to 3.
     Designed to sit alongside f_med text — same visual weight.
     """
-    draw_bitmap_rows(fb, x, y, _CLOCK_9, c=color)
+    assert type(x) is int and type(y) is int, _XY_MSG
+    if color == 1:
+        fb.blit(_CLOCK_FB, x, y, 0)
+    else:
+        draw_bitmap_rows(fb, x, y, _CLOCK_9, c=color)
 
 
 # ------------------------------------------------------------
@@ -299,11 +599,22 @@ _WIFI_OFF_6 = [
     "000010000",
 ]
 
+_WIFI_ON_6 = _bits(_WIFI_ON_6)
+_WIFI_OFF_6 = _bits(_WIFI_OFF_6)
+_WIFI_ON_FB = _compile(_WIFI_ON_6)
+_WIFI_OFF_FB = _compile(_WIFI_OFF_6)
+
 
 def draw_wifi(fb, x, y, on=True, color=1):
     """
     Draw compact WiFi indicator at (x, y). Size: 9x6.
     """
+    if _unchanged(fb, "wifi", x, y, (bool(on), color)):
+        return
+    assert type(x) is int and type(y) is int, _XY_MSG
+    if color == 1:
+        fb.blit(_WIFI_ON_FB if on else _WIFI_OFF_FB, x, y, 0)
+        return
     rows = _WIFI_ON_6 if bool(on) else _WIFI_OFF_6
     draw_bitmap_rows(fb, x, y, rows, c=color)
 
@@ -365,6 +676,13 @@ _GPS_PART_6 = [
     "00000000111111",
 ]
 
+_GPS_TRI_6 = _bits(_GPS_TRI_6)
+_GPS_EMPTY_6 = _bits(_GPS_EMPTY_6)
+_GPS_PART_6 = _bits(_GPS_PART_6)
+_GPS_TRI_FB = _compile(_GPS_TRI_6)
+_GPS_EMPTY_FB = _compile(_GPS_EMPTY_6)
+_GPS_PART_FB = _compile(_GPS_PART_6)
+
 
 def draw_gps(fb, x, y, on=True, color=1, state=None):
     """
@@ -375,7 +693,19 @@ def draw_gps(fb, x, y, on=True, color=1, state=None):
     """
     if state is None:
         state = GPS_FIXED if bool(on) else GPS_NONE
-    state = int(state)
+
+    if _unchanged(fb, "gps", x, y, (state, color)):
+        return
+    assert type(x) is int and type(y) is int, _XY_MSG
+    if color == 1:
+        if state == GPS_NONE:
+            gfb = _GPS_EMPTY_FB
+        elif state == GPS_INIT:
+            gfb = _GPS_PART_FB
+        else:
+            gfb = _GPS_TRI_FB
+        fb.blit(gfb, x, y, 0)
+        return
 
     if state == GPS_NONE:
         draw_bitmap_rows(fb, x, y, _GPS_EMPTY_6, c=color)
@@ -416,6 +746,32 @@ _API_FILLED_6 = [
     "0011100",
 ]
 
+_API_RING_6 = _bits(_API_RING_6)
+_API_FILLED_6 = _bits(_API_FILLED_6)
+_API_RING_FB = _compile(_API_RING_6)
+_API_FILLED_FB = _compile(_API_FILLED_6)
+
+
+# Last heartbeat result: [20 ms bucket, sending, filled].
+# Every phase edge and cycle length below is a multiple of 20 ms, so the
+# answer is constant within a bucket and can be reused across redraws.
+_HB_CACHE = [-1, False, False]
+
+# time.ticks_ms, bound lazily on the first heartbeat lookup so importing
+# glyphs (and drawing static glyphs) never touches the time module.
+_ticks_ms = None
+
+
+def _now_ms():
+    global _ticks_ms
+    if _ticks_ms is None:
+        import time
+        try:
+            _ticks_ms = time.ticks_ms
+        except AttributeError:
+            _ticks_ms = lambda: int(time.time() * 1000)
+    return _ticks_ms()
+
 
 def _api_heartbeat_on(now_ms=None, sending=False):
     """
@@ -424,22 +780,40 @@ def _api_heartbeat_on(now_ms=None, sending=False):
     Sending : off/on/off/on over 2 s.  Cycle = 2 s (unchanged).
     Returns True when circle should be FILLED.
     """
-    try:
-        if now_ms is None:
-            now_ms = time.ticks_ms()
-    except Exception:
-        now_ms = int(time.time() * 1000)
+    if now_ms is None:
+        now_ms = _now_ms()
+
+    sending = bool(sending)
+    bucket = now_ms // 20
+    hb = _HB_CACHE
+    if bucket == hb[0] and sending == hb[1]:
+        return hb[2]
 
     if sending:
         t = now_ms % 2000
         # off 500 ms | on 500 ms | off 500 ms | on 500 ms
-        return 500 <= t < 1000 or t >= 1500
+        filled = 500 <= t < 1000 or t >= 1500
     else:
         t = now_ms % 8200
         if t < 7000:
-            return True          # solid hold
-        burst = (t - 7000) // 200   # 0..5 frame index within burst
-        return burst % 2 == 1       # frames 1,3,5 = ON; 0,2,4 = OFF
+            filled = True           # solid hold
+        else:
+            burst = (t - 7000) // 200   # 0..5 frame index within burst
+            filled = burst % 2 == 1     # frames 1,3,5 = ON; 0,2,4 = OFF
+
+    hb[0] = bucket
+    hb[1] = sending
+    hb[2] = filled
+    return filled
+
+
+def api_heartbeat_filled(now_ms=None, sending=False):
+    """
+    Public heartbeat phase: True when the API circle should be FILLED.
+    Compute once per frame and pass to draw_api(filled=...) so the draw
+    itself does no time math.
+    """
+    return _api_heartbeat_on(now_ms=now_ms, sending=sending)
 
 
 def _api_center_dot_xy():
@@ -453,14 +827,11 @@ def _api_draw_center_dot(fb, x, y, on=True):
     Clearing works because we draw a 0 pixel on top of the filled glyph.
     """
     dx, dy = _api_center_dot_xy()
-    try:
-        fb.pixel(int(x) + dx, int(y) + dy, 1 if on else 0)
-    except Exception:
-        # fallback: ignore if framebuffer doesn't support pixel writes (unlikely)
-        pass
+    _pix_i(fb, x + dx, y + dy, 1 if on else 0)
 
 
-def draw_api(fb, x, y, on=True, color=1, *, heartbeat=False, sending=False, now_ms=None):
+def draw_api(fb, x, y, on=True, color=1, *, heartbeat=False, sending=False, now_ms=None,
+             filled=None):
     """
     Draw API indicator at (x, y).
 
@@ -470,18 +841,25 @@ def draw_api(fb, x, y, on=True, color=1, *, heartbeat=False, sending=False, now_
     - on=True, heartbeat=True,
         sending=False  -> solid 4 s, then off/on/off/on burst 0.5 s  (4.5 s cycle)
         sending=True   -> off/on/off/on over 2 s  (2 s cycle)
-    """
-    x = int(x)
-    y = int(y)
 
+    filled: precomputed heartbeat phase (see api_heartbeat_filled());
+            when given with on=True it replaces the heartbeat lookup.
+    """
     if not bool(on):
         filled = False
+    elif filled is not None:
+        filled = bool(filled)
     elif heartbeat:
         filled = _api_heartbeat_on(now_ms=now_ms, sending=sending)
     else:
         filled = True
 
-    if filled:
+    if _unchanged(fb, "api", x, y, (filled, color)):
+        return
+    assert type(x) is int and type(y) is int, _XY_MSG
+    if color == 1:
+        fb.blit(_API_FILLED_FB if filled else _API_RING_FB, x, y, 0)
+    elif filled:
         draw_bitmap_rows(fb, x, y, _API_FILLED_6, c=color)
     else:
         draw_bitmap_rows(fb, x, y, _API_RING_6, c=color)
\ No newline at end of file
@@ -1,8 +1,9 @@
 # src/ui/oled.py  (MicroPython / Pico W / ESP32)
 import time
 import framebuf
-import math
+import micropython
 from machine import Pin, I2C
+from micropython import const
 
 # AirBuddy font registry + ezFBfont writer
 from src import fonts
@@ -12,6 +13,69 @@ from src.drivers.ezFBfont import ezFBfont
 from src.ui.waiting import WaitingScreen
 
 
+# OLED._text_size() memo: (id(writer), text) -> (w, h). Writers live as
+# long as the OLED; the cap keeps changing numeric strings from growing
+# it without bound (cleared wholesale when full).
+_SIZE_CACHE = {}
+_SIZE_CACHE_MAX = 64
+
+# OLED._num_width() per-writer char advances: id(writer) -> {ch: width}.
+# Readings only use digits and "%", so this stays tiny and never churns.
+_ADV_CACHE = {}
+
+# OLED._num_text() memo: (n, suffix) -> str. Readings and confidence
+# repeat (or jitter within a few values) frame to frame; same cap/clear.
+_NUM_TXT = {}
+_NUM_TXT_MAX = 32
+
+# cos(a) for a = 0, 10 .. 350 degrees, fixed point (x 16384). sin(a) is
+# _COS10[(i + 27) % 36]. Keeps math/float out of the show_face() ring.
+_COS10 = (
+    16384, 16135, 15396, 14189, 12551, 10531, 8192, 5604, 2845,
+    0, -2845, -5604, -8192, -10531, -12551, -14189, -15396, -16135,
+    -16384, -16135, -15396, -14189, -12551, -10531, -8192, -5604, -2845,
+    0, 2845, 5604, 8192, 10531, 12551, 14189, 15396, 16135,
+)
+
+
+# Controller commands used outside the init sequence
+_DISP_OFF = const(0xAE)
+_DISP_ON = const(0xAF)
+_SET_COL_WIN = const(0x21)    # SSD1306 horizontal mode: column window
+_SET_PAGE_WIN = const(0x22)   # SSD1306 horizontal mode: page window
+_PAGE_ADDR = const(0xB0)      # page addressing: select page (0..7)
+_COL_LO = const(0x00)         # page addressing: column low nibble
+_COL_HI = const(0x10)         # page addressing: column high nibble
+
+
+@micropython.viper
+def _frame_hash(buf: ptr8, n: int) -> int:
+    # FNV-1a over the frame, folded to 30 bits (stays a small int)
+    h = 0x811C9DC5 & 0x3FFFFFFF
+    i = 0
+    while i < n:
+        h = ((h ^ buf[i]) * 16777619) & 0x3FFFFFFF
+        i += 1
+    return h
+
+
+_INIT_SEQ = bytes((
+    0x00,       # control byte: command stream
+    0xAE,       # display off
+    0x20, 0x00, # memory addressing mode (horizontal)
+    0x40,       # start line
+    0xA1,       # seg remap
+    0xC8,       # COM scan dec
+    0xDA, 0x12, # COM pins
+    0x81, 0x7F, # contrast
+    0xA4,       # display follows RAM
+    0xA6,       # normal display
+    0xD5, 0x80, # display clock divide
+    0x8D, 0x14, # charge pump
+    0xAF,       # display on
+))
+
+
 class SSD1306_I2C(framebuf.FrameBuffer):
     """
     Minimal SSD1306/SH1106-compatible I2C framebuffer driver (128x64).
@@ -29,59 +93,150 @@ class SSD1306_I2C(framebuf.FrameBuffer):
         self.pages = self.height // 8
         self.col_offset = int(col_offset) if col_offset is not None else 0
 
-        self.buffer = bytearray(self.pages * self.width)
+        # One TX buffer: byte 0 is the 0x40 data control byte and the rest
+        # is the framebuffer itself, so a full frame goes out as a single
+        # writeto() with no slicing or concatenation.
+        n = self.pages * self.width
+        self._tx = bytearray(1 + n)
+        self._tx[0] = 0x40
+        self.buffer = memoryview(self._tx)[1:]
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
+
+        # SH1106 path (no horizontal addressing): per-page views and
+        # pre-built page/column commands, so show() allocates nothing.
+        w = self.width
+        col = self.col_offset
+        self._page_mv = tuple(self.buffer[p * w:(p + 1) * w] for p in range(self.pages))
+        self._page_cmd = tuple(
+            bytes((0x00, _PAGE_ADDR + p, _COL_LO | (col & 0x0F), _COL_HI | ((col >> 4) & 0x0F)))
+            for p in range(self.pages)
+        )
+        self._win_full = bytes((0x00, _SET_COL_WIN, 0, w - 1, _SET_PAGE_WIN, 0, self.pages - 1))
+        self._writevto = getattr(i2c, "writevto", None)
+        self._vec = [b"\x40", None]
+
+        # Ports without writevto: one persistent page TX buffer (0x40 +
+        # up to one page of data) that page/region slices are copied into.
+        self._page_tx = bytearray(1 + w)
+        self._page_tx[0] = 0x40
+        self._page_txmv = memoryview(self._page_tx)
+
+        # Reused command buffers (filled in place, no per-call bytes())
+        self._cmd1 = bytearray(2)       # 0x00, cmd
+        self._cmd_pc = bytearray(4)     # 0x00, page, col lo, col hi
+        self._cmd_win = bytearray(7)    # 0x00, 0x21, c0, c1, 0x22, p0, p1
+        self._cmd_win[1] = _SET_COL_WIN
+        self._cmd_win[4] = _SET_PAGE_WIN
+
+        # Bumped on every full fill(); glyphs uses it to drop its
+        # "already drawn here" cache once the screen has been cleared.
+        self.gen = 0
+
+        # Hash of the frame the panel holds after the last full show();
+        # -1 = unknown (never sent, or a partial upload since).
+        self._last_hash = -1
+
         self._init_display()
 
     def _write_cmd(self, cmd):
-        self.i2c.writeto(self.addr, bytes([0x00, cmd]))
+        b = self._cmd1
+        b[1] = cmd
+        self.i2c.writeto(self.addr, b)
+
+    def _write_data(self, mv):
+        # 0x40 prefix + data in one transaction; writevto avoids the copy,
+        # otherwise reuse the page TX buffer (no per-page concatenation)
+        if self._writevto is not None:
+            vec = self._vec
+            vec[1] = mv
+            self._writevto(self.addr, vec)
+        else:
+            n = len(mv)
+            tx = self._page_txmv
+            tx[1:1 + n] = mv
+            self.i2c.writeto(self.addr, self._page_tx if n == self.width else tx[:1 + n])
 
     def _set_page_col(self, page, col):
         """
         Set current page + column. Works for SSD1306 and SH1106-style addressing.
         """
-        self._write_cmd(0xB0 + (page & 0x0F))
-        self._write_cmd(0x00 | (col & 0x0F))          # low nibble
-        self._write_cmd(0x10 | ((col >> 4) & 0x0F))   # high nibble
+        b = self._cmd_pc
+        b[1] = _PAGE_ADDR + (page & 0x0F)
+        b[2] = _COL_LO | (col & 0x0F)           # low nibble
+        b[3] = _COL_HI | ((col >> 4) & 0x0F)    # high nibble
+        self.i2c.writeto(self.addr, b)
 
     def _init_display(self):
         # This init sequence is SSD1306-ish, but works on a lot of SH1106 boards too.
         # The critical SH1106 difference for your symptom is the column offset in show().
-        for cmd in (
-                0xAE,       # display off
-                0x20, 0x00, # memory addressing mode (horizontal)
-                0x40,       # start line
-                0xA1,       # seg remap
-                0xC8,       # COM scan dec
-                0xDA, 0x12, # COM pins
-                0x81, 0x7F, # contrast
-                0xA4,       # display follows RAM
-                0xA6,       # normal display
-                0xD5, 0x80, # display clock divide
-                0x8D, 0x14, # charge pump
-                0xAF        # display on
-        ):
-            self._write_cmd(cmd)
+        # Sent as one command stream (single 0x00 control byte, one START/STOP).
+        self.i2c.writeto(self.addr, _INIT_SEQ)
         self.fill(0)
         self.show()
 
+    def fill(self, c):
+        self.gen += 1
+        super().fill(c)
+
     def poweroff(self):
-        self._write_cmd(0xAE)
+        self._write_cmd(_DISP_OFF)
 
     def poweron(self):
-        self._write_cmd(0xAF)
+        self._write_cmd(_DISP_ON)
 
-    def show(self):
+    def show(self, force=False):
         """
         Push framebuffer to display.
         col_offset fixes SH1106 132-column RAM mapping issues (removes edge stripe).
+
+        col_offset == 0 (SSD1306): horizontal addressing auto-wraps across
+        pages, so the whole frame is one burst from the TX buffer.
+        Otherwise (SH1106): one page at a time, two transactions per page.
+
+        A frame identical to the last one sent is skipped (no I2C at all);
+        force=True always transmits.
         """
-        col = self.col_offset
+        h = _frame_hash(self._tx, len(self._tx))
+        if h == self._last_hash and not force:
+            return
+        self._last_hash = h
+        if self.col_offset == 0:
+            self.i2c.writeto(self.addr, self._win_full)
+            self.i2c.writeto(self.addr, self._tx)
+            return
+
+        cmds = self._page_cmd
+        pages = self._page_mv
         for page in range(self.pages):
+            self.i2c.writeto(self.addr, cmds[page])
+            self._write_data(pages[page])
+
+    def show_region(self, x0, p0, x1, p1):
+        """
+        Push only columns x0..x1 of pages p0..p1 (inclusive).
+        SSD1306 gets a 0x21/0x22 window; SH1106 uses page/column addressing
+        so its column offset still applies.
+        """
+        self._last_hash = -1
+        buf = self.buffer
+        w = self.width
+        if self.col_offset == 0:
+            b = self._cmd_win
+            b[2] = x0
+            b[3] = x1
+            b[5] = p0
+            b[6] = p1
+            self.i2c.writeto(self.addr, b)
+            for page in range(p0, p1 + 1):
+                start = w * page
+                self._write_data(buf[start + x0:start + x1 + 1])
+            return
+
+        col = self.col_offset + x0
+        for page in range(p0, p1 + 1):
             self._set_page_col(page, col)
-            start = self.width * page
-            end = start + self.width
-            self.i2c.writeto(self.addr, b"\x40" + self.buffer[start:end])
+            start = w * page
+            self._write_data(buf[start + x0:start + x1 + 1])
 
 
 class OLED:
@@ -107,12 +262,15 @@ class OLED:
             i2c_id=0,
             pin_sda=None,
             pin_scl=None,
-            freq=100_000,
+            freq=400_000,
             col_offset=2,
     ):
         self.width = int(width)
         self.height = int(height)
 
+        # (i2c_id, scl, sda) when we own the bus, so set_freq() can rebuild it
+        self._bus_pins = None
+
         # 1) Prefer injected bus
         if i2c is not None:
             self.i2c = i2c
@@ -120,11 +278,13 @@ class OLED:
         # 2) If explicit pins provided, honor them (backwards compatible)
         elif pin_sda is not None and pin_scl is not None:
             self.i2c = I2C(i2c_id, sda=Pin(pin_sda), scl=Pin(pin_scl), freq=freq)
+            self._bus_pins = (i2c_id, pin_scl, pin_sda)
 
         # 3) Otherwise, use HAL-selected pins for current board
         else:
-            from src.hal.board import init_i2c
+            from src.hal.board import init_i2c, i2c_pins
             self.i2c = init_i2c()
+            self._bus_pins = i2c_pins()[:3]
 
         self.oled = SSD1306_I2C(width, height, self.i2c, addr=addr, col_offset=col_offset)
 
@@ -140,17 +300,129 @@ class OLED:
         # Screens
         self.waiting_screen = WaitingScreen(flip_x=False, flip_y=True, gap=6)
 
-        self.clear()
+        # show_face() geometry, built on first use (see _face_geometry)
+        self._face_geom = None
+
+        # SSD1306_I2C init already pushed a blank frame
+        self.reset_fb()
 
     # ----------------------------
     # Helpers
     # ----------------------------
     def clear(self):
+        # Blank the panel now (explicit screen-off / wipe use)
         self.oled.fill(0)
         self.oled.show()
 
+    def reset_fb(self):
+        # Blank the framebuffer only, no I2C push: for screens that redraw
+        # the whole frame and show() it themselves.
+        self.oled.fill(0)
+
+    def set_freq(self, hz):
+        """
+        Re-clock the display bus, e.g. drop to 100_000 if a board NACKs at
+        400 kHz. The bus is shared with the DS3231/sensors, so this affects
+        them too. Returns True on success.
+        """
+        hz = int(hz)
+        try:
+            self.i2c.init(freq=hz)
+            return True
+        except Exception:
+            pass
+        if self._bus_pins is None:
+            return False
+        try:
+            i2c_id, scl, sda = self._bus_pins
+            self.i2c = I2C(i2c_id, scl=Pin(scl), sda=Pin(sda), freq=hz)
+        except Exception:
+            return False
+        self.oled.i2c = self.i2c
+        self.oled._writevto = getattr(self.i2c, "writevto", None)
+        return True
+
     def _text_size(self, writer, text):
-        return writer.size(text)
+        # Fixed labels are measured over and over; ezFBfont.size() walks
+        # every glyph, a dict hit doesn't.
+        k = (id(writer), text)
+        v = _SIZE_CACHE.get(k)
+        if v is None:
+            if len(_SIZE_CACHE) >= _SIZE_CACHE_MAX:
+                _SIZE_CACHE.clear()
+            v = writer.size(text)
+            _SIZE_CACHE[k] = v
+        return v
+
+    def _num_width(self, writer, text):
+        """
+        Width of a numeric string (digits, "%", ...) from cached per-char
+        advances, matching writer.size(text)[0] without a per-value memo
+        entry. Writers without hgap fall back to _text_size().
+        """
+        hgap = getattr(writer, "hgap", None)
+        if hgap is None:
+            return self._text_size(writer, text)[0]
+        adv = _ADV_CACHE.get(id(writer))
+        if adv is None:
+            adv = {}
+            _ADV_CACHE[id(writer)] = adv
+        w = 0
+        for ch in text:
+            cw = adv.get(ch)
+            if cw is None:
+                cw = writer.size(ch)[0]
+                adv[ch] = cw
+            if cw > 0:
+                w += cw + hgap
+        return w - hgap if w else 0
+
+    def _num_text(self, n, suffix=""):
+        # str(n) + suffix, reusing the same string object for repeats (so
+        # the _text_size memo hits on it too).
+        k = (n, suffix)
+        v = _NUM_TXT.get(k)
+        if v is None:
+            if len(_NUM_TXT) >= _NUM_TXT_MAX:
+                _NUM_TXT.clear()
+            v = str(n) + suffix
+            _NUM_TXT[k] = v
+        return v
+
+    def _dec1_text(self, x):
+        # x to one decimal ("23.4", "-0.5") via integer tenths rather than
+        # float formatting; repeats share _num_text's cache. None when x
+        # isn't numeric (callers draw their own "--.-").
+        try:
+            f = float(x)
+            i = int(f * 10 + (0.5 if f >= 0 else -0.5))
+        except Exception:
+            return None
+        k = (i, ".1")
+        v = _NUM_TXT.get(k)
+        if v is None:
+            if len(_NUM_TXT) >= _NUM_TXT_MAX:
+                _NUM_TXT.clear()
+            a = -i if i < 0 else i
+            v = "%s%d.%d" % ("-" if i < 0 else "", a // 10, a % 10)
+            _NUM_TXT[k] = v
+        return v
+
+    def text_sprite(self, writer, text):
+        """
+        Render static text once into an offscreen MONO_VLSB FrameBuffer.
+        Writers draw opaque (tkey=-1), so fb.blit(sprite, x, y) puts down
+        exactly what writer.write(text, x, y) would, in one C call.
+        """
+        w, h = self._text_size(writer, text)
+        spr = framebuf.FrameBuffer(bytearray(w * ((h + 7) // 8)), w, h, framebuf.MONO_VLSB)
+        dev = writer._device
+        writer._device = spr
+        try:
+            writer.write(text, 0, 0)
+        finally:
+            writer._device = dev
+        return spr
 
     def _center_x(self, writer, text):
         w, _ = self._text_size(writer, text)
@@ -230,6 +502,39 @@ class OLED:
         self._draw_tag_bottom_right(tag)
         self.oled.show()
 
+    def _face_geometry(self, label_y):
+        """
+        (cx, cy, r, ring, smile, frown) for show_face(). The screen size is
+        fixed, so the ring (integer cos/sin table) and the parabolic mouths
+        are computed once into (x, y) tuples instead of on every call.
+        """
+        g = self._face_geom
+        if g is not None:
+            return g
+
+        cx = self.width // 2
+        cy = (label_y // 2) + 2
+        r = min(22, (label_y // 2) - 2)
+
+        ring = []
+        for i in range(36):
+            x = cx + ((r * _COS10[i]) >> 14)
+            y = cy + ((r * _COS10[(i + 27) % 36]) >> 14)
+            if 0 <= x < self.width and 0 <= y < self.height:
+                ring.append((x, y))
+
+        mouth_y = cy + (r // 3)
+        smile = []
+        frown = []
+        for dx in range(-r // 2, r // 2 + 1):
+            dy = (dx * dx) // (r) // 2
+            smile.append((cx + dx, mouth_y + dy))
+            frown.append((cx + dx, mouth_y - dy))
+
+        g = (cx, cy, r, tuple(ring), tuple(smile), tuple(frown))
+        self._face_geom = g
+        return g
+
     def show_face(self, air_rating):
         rating_raw = (air_rating or "Ok").strip() or "Ok"
         rating = rating_raw.lower().replace("-", " ").replace("_", " ")
@@ -241,15 +546,11 @@ class OLED:
         label_y = self.height - 12
         self.draw_centered(self.f_small, label, label_y)
 
-        cx = self.width // 2
-        cy = (label_y // 2) + 2
-        r = min(22, (label_y // 2) - 2)
+        cx, cy, r, ring, smile, frown = self._face_geometry(label_y)
+        pixel = self.oled.pixel
 
-        for a in range(0, 360, 10):
-            x = int(cx + r * math.cos(math.radians(a)))
-            y = int(cy + r * math.sin(math.radians(a)))
-            if 0 <= x < self.width and 0 <= y < self.height:
-                self.oled.pixel(x, y, 1)
+        for x, y in ring:
+            pixel(x, y, 1)
 
         eye_dx = r // 2
         eye_y = cy - (r // 3)
@@ -258,15 +559,13 @@ class OLED:
 
         mouth_y = cy + (r // 3)
         if rating in ("very good", "verygood", "good"):
-            for dx in range(-r // 2, r // 2 + 1):
-                y = mouth_y + (dx * dx) // (r) // 2
-                self.oled.pixel(cx + dx, y, 1)
+            for x, y in smile:
+                pixel(x, y, 1)
         elif rating == "ok":
             self.oled.hline(cx - r // 2, mouth_y, r, 1)
         else:
-            for dx in range(-r // 2, r // 2 + 1):
-                y = mouth_y - (dx * dx) // (r) // 2
-                self.oled.pixel(cx + dx, y, 1)
+            for x, y in frown:
+                pixel(x, y, 1)
 
         self.oled.show()
 
@@ -2,9 +2,9 @@
 # CO₂ screen for AirBuddy (RAM-lean)
 # Pico / MicroPython safe
 
-import gc
-from src.ui.thermobar import ThermoBar
-from src.ui.glyphs import draw_sub2, draw_face9
+from src.ui.clicks import gc_maybe
+from src.ui.thermobar import ThermoBar, step_table, step_lookup
+from src.ui.glyphs import draw_sub2, draw_face9, MOOD_GOOD, MOOD_VERYBAD
 
 
 class CO2Screen:
@@ -12,6 +12,7 @@ class CO2Screen:
 
     # ppm -> step mapping edges (11 points = 10 bins)
     _EDGES = (400, 550, 700, 850, 1000, 1300, 1600, 2000, 2600, 3400, 5000)
+    _STEPS = step_table(_EDGES)
 
     # Fixed UI strings (avoid re-alloc each call)
     _TXT_ECO = "eCO"
@@ -20,13 +21,86 @@ class CO2Screen:
     _TXT_NA = "SENSOR NOT READY"
     _TXT_XX = "XX%"
 
-    # Fixed scale labels
-    _SCALE_TXT = ("400", "1000", "2000", "5000")
-    _SCALE_X = (2, 40, 78, 108)
+    # Fixed scale labels: (text, label x, tick nudge px kept from tuning)
+    _SCALE = (
+        ("400", 2, 0),
+        ("1000", 40, 5),
+        ("2000", 78, -1),
+        ("5000", 108, -2),
+    )
 
-    # Bottom labels
-    _LBL_TXT = ("OK", "MEH", "BAD")
-    _LBL_X = (30, 56, 82)
+    # Bottom labels: (text, x)
+    _LABELS = (("OK", 30), ("MEH", 56), ("BAD", 82))
+
+    # Faces
+    left_face = MOOD_GOOD
+    right_face = MOOD_VERYBAD
+    left_face_x = 2
+    right_face_x = 110
+
+    # Bar rows
+    scale_y = 34
+    bar_y = 45
+
+    # Layout derived from the fonts and display size, filled in once by
+    # _init_layout() (main.py rebuilds screens on every carousel entry)
+    _layout_oled = None
+
+    @classmethod
+    def _init_layout(cls, oled):
+        w = oled.width
+        h = oled.height
+        cls._screen_w = w
+
+        cls.bar_x = 2
+        cls.bar_w = w - 4
+
+        cls.faces_y = 0 if h < 9 else (h - 9)
+
+        # labels baseline aligned to vsmall height
+        _, h_vs = oled._text_size(oled.f_vsmall, "Ag")
+        labels_y = cls.faces_y + 9 - h_vs
+        cls.labels_y = labels_y if labels_y > 0 else 0
+
+        f_title = getattr(oled, "f_arvo", None) or oled.f_med
+        w_small = getattr(oled, "f_small", None) or oled.f_vsmall
+
+        # Fixed widths (avoid repeated .size() calls)
+        cls._w_eco = oled._text_size(f_title, cls._TXT_ECO)[0]
+        cls._w_ppm = oled._text_size(w_small, cls._TXT_PPM)[0]
+
+        # Inner limits (must match ThermoBar inset logic)
+        inner_x = cls.bar_x + 2
+        inner_w = cls.bar_w - 4
+        if inner_w < 1:
+            inner_w = 1
+        lo = inner_x
+        hi = inner_x + inner_w - 1
+        cls._inner_lo = lo
+        cls._inner_hi = hi
+
+        # Tick X positions aligned to label centers + nudges, clamped to the track
+        tick_x = []
+        for txt, x_label, nudge in cls._SCALE:
+            x_center = x_label + (oled._text_size(w_small, txt)[0] // 2) + nudge
+            if x_center < lo:
+                x_center = lo
+            elif x_center > hi:
+                x_center = hi
+            tick_x.append(x_center)
+        cls._tick_x = tuple(tick_x)
+
+        # Static words pre-rendered once per display (one blit per frame
+        # instead of ezFBfont's per-character loop); shared by every
+        # instance, since main.py rebuilds the screen on each visit.
+        sprite = oled.text_sprite
+        cls._scale_sprites = tuple((sprite(w_small, txt), x) for txt, x, _ in cls._SCALE)
+        cls._label_sprites = tuple((sprite(oled.f_vsmall, txt), x) for txt, x in cls._LABELS)
+        cls._eco_sprite = sprite(f_title, cls._TXT_ECO)
+        cls._ppm_sprite = sprite(w_small, cls._TXT_PPM)
+        cls._conf_sprite = sprite(w_small, cls._TXT_CONF)
+
+        cls._layout_oled = oled
 
     def __init__(self, oled):
         self.oled = oled
@@ -44,76 +118,20 @@ class CO2Screen:
         # Bar
         self.bar = ThermoBar(oled)
 
-        # Layout
-        w = int(self.oled.width)
-        h = int(self.oled.height)
-
-        self.bar_x = 2
-        self.bar_w = w - 4
-
-        self.scale_y = 34
-        self.bar_y = 45
-
-        self.faces_y = 0 if h < 9 else (h - 9)
-
-        # labels baseline aligned to vsmall height
-        _, h_vs = self.oled._text_size(self.f_vs, "Ag")
-        self.labels_y = self.faces_y + 9 - h_vs
-        if self.labels_y < 0:
-            self.labels_y = 0
-
-        self.left_face = "good"
-        self.right_face = "verybad"
-        self.left_face_x = 2
-        self.right_face_x = 110
-
-        # Precompute fixed widths (avoid repeated .size() calls)
-        self._w_eco, _ = (self.f_arvo if self.f_arvo else self.f_med).size(self._TXT_ECO)
-        self._w_ppm, _ = self.w_small.size(self._TXT_PPM)
-        self._scale_w = []
-        for t in self._SCALE_TXT:
-            tw, _ = self.w_small.size(t)
-            self._scale_w.append(int(tw))
-
-        # Precompute inner limits (must match ThermoBar inset logic)
-        inner_x = self.bar_x + 2
-        inner_w = self.bar_w - 4
-        if inner_w < 1:
-            inner_w = 1
-        self._inner_lo = inner_x
-        self._inner_hi = inner_x + inner_w - 1
-
-        # Precompute tick X positions aligned to label centers + tiny offsets
-        # (replaces dict + index lookups)
-        self._tick_x = []
-        for i in range(4):
-            x_label = int(self._SCALE_X[i])
-            x_center = x_label + (self._scale_w[i] // 2)
-
-            # manual nudges (kept from your tuning)
-            if i == 1:      # 1000
-                x_center += 5
-            elif i == 2:    # 2000
-                x_center += -1
-            elif i == 3:    # 5000
-                x_center += -2
-
-            # clamp
-            if x_center < self._inner_lo:
-                x_center = self._inner_lo
-            elif x_center > self._inner_hi:
-                x_center = self._inner_hi
-
-            self._tick_x.append(int(x_center))
+        if CO2Screen._layout_oled is not oled:
+            CO2Screen._init_layout(oled)
 
     # -------------------------------------------------
     # Public API
     # -------------------------------------------------
     def show(self, reading, confidence_pct=None):
-        self.oled.clear()
+        self.oled.reset_fb()
+        self._draw_scale_numbers()
+        self._draw_fixed_ticks()
+        self._draw_bottom_labels()
 
-        # free memory right before first draw/write burst
-        gc.collect()
+        # free memory before the draw/write burst, when the heap has grown
+        gc_maybe()
 
         ppm = int(getattr(reading, "eco2_ppm", 0))
         ready = bool(getattr(reading, "ready", True))
@@ -139,13 +157,10 @@ class CO2Screen:
                 conf = 0
             elif conf > 100:
                 conf = 100
-            conf_text = str(conf) + "%"
+            conf_text = self.oled._num_text(conf, "%")
 
         self._draw_header(ppm, conf_text, not_ready)
-        self._draw_scale_numbers()
         self._draw_bar(ppm, not_ready)
-        self._draw_fixed_ticks()
-        self._draw_bottom_labels()
 
         self.oled.oled.show()
 
@@ -157,19 +172,19 @@ class CO2Screen:
         y_title = 2
         status_y = 19
 
-        title_writer = self.f_arvo if self.f_arvo else self.f_med
+        blit = self.oled.oled.blit
 
-        # Title (no faux-bold)
-        title_writer.write(self._TXT_ECO, x0, y_title)
+        # Title (no faux-bold; pre-rendered)
+        blit(self._eco_sprite, x0, y_title)
 
-        sub2_x = x0 + int(self._w_eco) + 1
+        sub2_x = x0 + self._w_eco + 1
         sub2_y = y_title + 10
         draw_sub2(self.oled.oled, sub2_x, sub2_y, scale=1, color=1)
 
         # "PPM"
         ppm_x = sub2_x + 6
         ppm_y = y_title + (4 if self.w_small is self.f_small else 5)
-        self.w_small.write(self._TXT_PPM, ppm_x, ppm_y)
+        blit(self._ppm_sprite, ppm_x, ppm_y)
 
         # Status
         if not_ready:
@@ -177,88 +192,64 @@ class CO2Screen:
         else:
             yy = status_y + (1 if self.w_small is self.f_small else 0)
             self.w_small.write(conf_text, x0, yy)
-            w_pct, _ = self.w_small.size(conf_text)
-            self.w_small.write(self._TXT_CONF, x0 + int(w_pct) + 6, yy)
+            w_pct = self.oled._num_width(self.w_small, conf_text)
+            blit(self._conf_sprite, x0 + w_pct + 6, yy)
 
         # Value (only when ready)
         if not not_ready:
-            val = str(int(ppm))
-            tw, _ = self.f_large.size(val)
-            x = int(self.oled.width) - int(tw) - 2
+            val = self.oled._num_text(ppm)
+            tw = self.oled._num_width(self.f_large, val)
+            x = self._screen_w - tw - 2
             self.f_large.write(val, x, 2)
 
     def _draw_scale_numbers(self):
         y = self.scale_y
-        w = self.w_small
-        # manual loop avoids zip() iterator object
-        w.write(self._SCALE_TXT[0], self._SCALE_X[0], y)
-        w.write(self._SCALE_TXT[1], self._SCALE_X[1], y)
-        w.write(self._SCALE_TXT[2], self._SCALE_X[2], y)
-        w.write(self._SCALE_TXT[3], self._SCALE_X[3], y)
-
-    def _ppm_to_step_p(self, ppm):
-        edges = self._EDGES
-        if ppm <= edges[0]:
-            return 0.0
-        if ppm >= edges[-1]:
-            return 1.0
-
-        # 10 bins
-        for i in range(10):
-            if edges[i] <= ppm < edges[i + 1]:
-                return (i + 1) / 10.0
-        return 1.0
+        blit = self.oled.oled.blit
+        for spr, x in self._scale_sprites:
+            blit(spr, x, y)
+
+    def _ppm_to_step(self, ppm):
+        # 10 bins -> int step 0..10 (fill = step / 10)
+        return step_lookup(self._STEPS, ppm)
 
     def _draw_bar(self, ppm, not_ready):
-        p = 0.0 if not_ready else self._ppm_to_step_p(int(ppm))
+        k = 0 if not_ready else self._ppm_to_step(ppm)
 
         self.bar.draw(
             x=self.bar_x,
             y=self.bar_y,
             w=self.bar_w,
-            p=p,
+            p_num=k,
+            p_den=10,
             outline=True,
             clear_bg=False
         )
 
-        # Pointer at end of fill
+        # Pointer at end of fill: round(k/10 * (bar_w - 1)) in integers
         if not not_ready:
-            x_end = self.bar_x + int(round(p * (self.bar_w - 1)))
+            x_end = self.bar_x + (k * (self.bar_w - 1) * 2 + 10) // 20
             if x_end < self.bar_x:
                 x_end = self.bar_x
             elif x_end > (self.bar_x + self.bar_w - 1):
                 x_end = self.bar_x + self.bar_w - 1
             self.oled.oled.pixel(x_end, self.bar_y - 1, 1)
 
-    def _draw_tick(self, x):
-        # 6px tall; starts 2px above border
-        y0 = self.bar_y - 2
-        fb = self.oled.oled
-        x = int(x)
-        fb.pixel(x, y0 + 0, 1)
-        fb.pixel(x, y0 + 1, 1)
-        fb.pixel(x, y0 + 2, 1)
-        fb.pixel(x, y0 + 3, 1)
-        fb.pixel(x, y0 + 4, 1)
-        fb.pixel(x, y0 + 5, 1)
-
     def _draw_fixed_ticks(self):
-        # 4 ticks at the 4 scale labels
-        tx = self._tick_x
-        self._draw_tick(tx[0])
-        self._draw_tick(tx[1])
-        self._draw_tick(tx[2])
-        self._draw_tick(tx[3])
+        # 4 ticks at the 4 scale labels: 6px tall, starting 2px above the
+        # border. One C vline each, no per-tick method dispatch.
+        vline = self.oled.oled.vline
+        y = self.bar_y - 2
+        for x in self._tick_x:
+            vline(x, y, 6, 1)
 
     def _draw_bottom_labels(self):
         y_face = self.faces_y
         y_text = self.labels_y
 
-        draw_face9(self.oled.oled, int(self.left_face_x), int(y_face), mood=self.left_face, scale=1, color=1)
+        draw_face9(self.oled.oled, self.left_face_x, y_face, mood=self.left_face, scale=1, color=1)
 
-        w = self.f_vs
-        w.write(self._LBL_TXT[0], self._LBL_X[0], y_text)
-        w.write(self._LBL_TXT[1], self._LBL_X[1], y_text)
-        w.write(self._LBL_TXT[2], self._LBL_X[2], y_text)
+        blit = self.oled.oled.blit
+        for spr, x in self._label_sprites:
+            blit(spr, x, y_text)
 
-        draw_face9(self.oled.oled, int(self.right_face_x), int(y_face), mood=self.right_face, scale=1, color=1)
+        draw_face9(self.oled.oled, self.right_face_x, y_face, mood=self.right_face, scale=1, color=1)
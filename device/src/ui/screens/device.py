@@ -17,9 +17,9 @@
 #   while still tolerating older flat payloads
 
 import time
-import gc
 
 from config import load_config
+from src.ui.clicks import gc_maybe, idle_wait
 
 try:
     from src.ui import connection_header as _ch
@@ -124,9 +124,7 @@ class DeviceScreen:
 
         fb.fill(0)
 
-        if not isinstance(api_info, dict):
-            api_info = {}
-
+        # The _pick_* helpers already treat a non-dict api_info as empty
         device = str(self._pick_device_name(api_info) or "AirBuddy")
         home = str(self._pick_home_name(api_info) or "")
         room = str(self._pick_room_name(api_info) or "")
@@ -139,13 +137,6 @@ class DeviceScreen:
 
         ow = int(getattr(self.oled, "width", 128))
 
-        # Title top-left in arvo20 at y=0
-        if self.f_title:
-            try:
-                self.f_title.write("Device", 0, 0)
-            except Exception:
-                pass
-
         # connectivity icons top-right at y=1
         if _ch:
             try:
@@ -153,37 +144,29 @@ class DeviceScreen:
             except Exception:
                 pass
 
-        # Home at y=24
-        if self.f_med:
-            try:
-                self.f_med.write(("Home: " + (home or "---"))[:20], 0, 24)
-            except Exception:
-                pass
-
-        # Room at y=37
-        if self.f_med:
-            try:
-                self.f_med.write(("Room: " + (room or "---"))[:20], 0, 37)
-            except Exception:
-                pass
-
-        # Device ID at y=50
-        if self.f_med:
-            try:
-                self.f_med.write(("Device ID: " + (device_id or "---"))[:20], 0, 50)
-            except Exception:
-                pass
-
+        # Text rows: __init__'s font fallbacks mean a failure here is a
+        # broken writer, so one guard covers all of them.
         try:
-            fb.show()
+            # Title top-left in arvo20 at y=0
+            if self.f_title:
+                self.f_title.write("Device", 0, 0)
+
+            f = self.f_med
+            if f:
+                # Home at y=24, Room at y=37, Device ID at y=50
+                f.write(("Home: " + (home or "---"))[:20], 0, 24)
+                f.write(("Room: " + (room or "---"))[:20], 0, 37)
+                f.write(("Device ID: " + (device_id or "---"))[:20], 0, 50)
         except Exception:
             pass
 
         try:
-            gc.collect()
+            fb.show()
         except Exception:
             pass
 
+        gc_maybe()
+
     # -------------------------------------------------
     # SHOW (brief)
     # -------------------------------------------------
@@ -235,4 +218,4 @@ class DeviceScreen:
             if action is not None:
                 return action
 
-            time.sleep_ms(25)
\ No newline at end of file
+            idle_wait(btn, 500 if tick_fn is None else time.ticks_diff(_tick_next, time.ticks_ms()))
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import time
 import gc
+import micropython
 
 from src.ui.toggle import ToggleSwitch
 
@@ -15,6 +16,38 @@ except Exception:
     GPS_FIXED = 2
 
 
+@micropython.viper
+def _nmea_deg(s: ptr8, n: int) -> int:
+    # Integer degrees from the first n ASCII digits of s (str buffer read
+    # in place, no slice); -1 if any of them isn't a digit.
+    v = 0
+    i = 0
+    while i < n:
+        c = s[i] - 48
+        if c < 0 or c > 9:
+            return -1
+        v = v * 10 + c
+        i += 1
+    return v
+
+
+def _nmea_skip(line, n):
+    # Index just past the n-th comma (start of field n)
+    pos = 0
+    for _ in range(n):
+        pos = line.find(",", pos) + 1
+    return pos
+
+
+def _nmea_field(line, start):
+    # (field starting at start, start of the following field). Only the
+    # fields we read are sliced; split(",") would build all ~13 of them.
+    end = line.find(",", start)
+    if end < 0:
+        return line[start:], len(line)
+    return line[start:end], end + 1
+
+
 class GPSScreen:
     def __init__(self, oled):
         self.oled = oled
@@ -51,6 +84,13 @@ class GPSScreen:
         self._next_check_ms = 0
         self._status = ""
 
+        # Title height is font-fixed: measure once, not per _draw()
+        try:
+            _, title_h = oled._text_size(oled.f_arvo20, "Ag")
+        except Exception:
+            title_h = 20
+        self._data_y = int(self._top_pad + title_h + 4)
+
         self._load_config()
 
     # ----------------------------
@@ -86,7 +126,11 @@ class GPSScreen:
             if dot < 0:
                 return None
             deg_len = 2 if hemi in ("N", "S") else 3
-            deg = int(s[:deg_len])
+            if dot < deg_len:
+                return None
+            deg = _nmea_deg(s, deg_len)
+            if deg < 0:
+                return None
             minutes = float(s[deg_len:])
             val = deg + (minutes / 60.0)
             if hemi in ("S", "W"):
@@ -97,13 +141,18 @@ class GPSScreen:
 
     def _parse_rmc(self, line):
         try:
-            p = line.split(",")
-            if len(p) < 7:
+            # $GxRMC,time,status,lat,N/S,lon,E/W,...
+            if line.count(",") < 6:
                 return
-            self.last_fix = (p[2] == "A")
-            if p[3] and p[4] and p[5] and p[6]:
-                lat = self._nmea_degmin_to_deg(p[3], p[4])
-                lon = self._nmea_degmin_to_deg(p[5], p[6])
+            status, pos = _nmea_field(line, _nmea_skip(line, 2))
+            lat_s, pos = _nmea_field(line, pos)
+            ns, pos = _nmea_field(line, pos)
+            lon_s, pos = _nmea_field(line, pos)
+            ew, _ = _nmea_field(line, pos)
+            self.last_fix = (status == "A")
+            if lat_s and ns and lon_s and ew:
+                lat = self._nmea_degmin_to_deg(lat_s, ns)
+                lon = self._nmea_degmin_to_deg(lon_s, ew)
                 if lat is not None and lon is not None:
                     self.last_lat = lat
                     self.last_lon = lon
@@ -112,19 +161,25 @@ class GPSScreen:
 
     def _parse_gga(self, line):
         try:
-            p = line.split(",")
-            if len(p) < 8:
+            # $GxGGA,time,lat,N/S,lon,E/W,quality,sats,...
+            if line.count(",") < 7:
                 return
-            if p[6] and p[6] != "0":
+            lat_s, pos = _nmea_field(line, _nmea_skip(line, 2))
+            ns, pos = _nmea_field(line, pos)
+            lon_s, pos = _nmea_field(line, pos)
+            ew, pos = _nmea_field(line, pos)
+            quality, pos = _nmea_field(line, pos)
+            sats, _ = _nmea_field(line, pos)
+            if quality and quality != "0":
                 self.last_fix = True
-            if p[7]:
+            if sats:
                 try:
-                    self.last_sats = int(p[7])
+                    self.last_sats = int(sats)
                 except Exception:
                     pass
-            if p[2] and p[3] and p[4] and p[5]:
-                lat = self._nmea_degmin_to_deg(p[2], p[3])
-                lon = self._nmea_degmin_to_deg(p[4], p[5])
+            if lat_s and ns and lon_s and ew:
+                lat = self._nmea_degmin_to_deg(lat_s, ns)
+                lon = self._nmea_degmin_to_deg(lon_s, ew)
                 if lat is not None and lon is not None:
                     self.last_lat = lat
                     self.last_lon = lon
@@ -144,9 +199,11 @@ class GPSScreen:
                 line = gps.read_nmea(max_ms=30)
                 if not line:
                     return
-                if "RMC" in line:
+                # read_nmea() only returns "$GP..."/"$GN..." lines, so the
+                # sentence type sits at [3:6]; startswith(.., 3) doesn't slice
+                if line.startswith("RMC", 3):
                     self._parse_rmc(line)
-                elif "GGA" in line:
+                elif line.startswith("GGA", 3):
                     self._parse_gga(line)
         except Exception:
             pass
@@ -222,12 +279,7 @@ class GPSScreen:
         title_y = self._top_pad
         o.f_arvo20.write("GPS", 0, title_y)
 
-        try:
-            _, title_h = o._text_size(o.f_arvo20, "Ag")
-        except Exception:
-            title_h = 20
-
-        data_y = int(title_y + title_h + 4)
+        data_y = self._data_y
         line_h = 13
 
         # Status line
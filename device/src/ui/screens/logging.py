@@ -3,6 +3,7 @@
 import time
 from config import load_config, save_config
 from src.ui.toggle import ToggleSwitch
+from src.ui.clicks import idle_wait
 
 try:
     from src.ui import connection_header as _ch
@@ -22,6 +23,10 @@ class LoggingScreen:
         self._api_base = ""
         self._single_grace_ms = 350
 
+        # Display strings, rebuilt only when config is (re)loaded
+        self._api_str = "---"
+        self._post_str = "Post: 120s"
+
     # ----------------------------
     # Config
     # ----------------------------
@@ -31,6 +36,8 @@ class LoggingScreen:
         self._enabled = bool(cfg.get("telemetry_enabled", True))
         self._post_every_s = int(cfg.get("telemetry_post_every_s", 120))
         self._api_base = str(cfg.get("api_base", "") or "")
+        self._api_str = (self._api_base or "---")[:18]
+        self._post_str = "Post: %ds" % self._post_every_s
         return cfg
 
     def _apply_toggle(self):
@@ -63,9 +70,8 @@ class LoggingScreen:
         o.f_arvo20.write("Telemetry", 0, 5)
         self.toggle.draw(fb, on=self._enabled)
 
-        api_str = (self._api_base or "---")[:18]
-        o.f_med.write(api_str, 0, 28)
-        o.f_med.write("Post: " + str(self._post_every_s) + "s", 0, 41)
+        o.f_med.write(self._api_str, 0, 28)
+        o.f_med.write(self._post_str, 0, 41)
 
         fb.show()
 
@@ -112,4 +118,9 @@ class LoggingScreen:
             elif action == "quad":
                 return "quad"
 
-            time.sleep_ms(25)
\ No newline at end of file
+            # Sleep until the next tick / single-click deadline (or a press)
+            now = time.ticks_ms()
+            wait = 500 if tick_fn is None else time.ticks_diff(_tick_next, now)
+            if pending_single_deadline is not None:
+                wait = min(wait, time.ticks_diff(pending_single_deadline, now))
+            idle_wait(btn, wait)
\ No newline at end of file
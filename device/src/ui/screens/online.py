@@ -6,6 +6,7 @@ from machine import RTC
 
 from config import load_config, save_config
 from src.ui.toggle import ToggleSwitch
+from src.ui.clicks import idle_wait, gc_maybe
 from src.net.telemetry_client import TelemetryClient
 from src.net.wifi_manager import WiFiManager
 
@@ -17,10 +18,43 @@ except Exception:
     GPS_NONE = 0
 
 
+# Shared across OnlineScreen instances: main clears its screen cache on
+# every carousel entry, so the screen itself is rebuilt each visit.
+_WIFI = None
+_CLIENT = None
+_CLIENT_KEY = None
+
+
+def _get_wifi():
+    global _WIFI
+    if _WIFI is None:
+        _WIFI = WiFiManager()
+    return _WIFI
+
+
+def _get_client(api_base, device_id, device_key):
+    # Reuse the client while the credentials it was built with still apply
+    global _CLIENT, _CLIENT_KEY
+    key = (api_base, device_id, device_key)
+    if _CLIENT is None or _CLIENT_KEY != key:
+        _CLIENT = TelemetryClient(
+            api_base=api_base,
+            device_id=device_id,
+            device_key=device_key
+        )
+        _CLIENT_KEY = key
+    return _CLIENT
+
+
 class OnlineScreen:
+    # Connecting animation frames, indexed by _dot_phase
+    _CONNECTING = ("Connecting", "Connecting.", "Connecting..", "Connecting...")
+
     def __init__(self, oled):
         self.oled = oled
-        self.wifi = WiFiManager()
+        self.wifi = _get_wifi()
+        # One RTC handle for handshake timestamps (read fresh each time)
+        self._rtc = RTC()
 
         self._top_pad = 5
 
@@ -40,13 +74,26 @@ class OnlineScreen:
 
         self.toggle = ToggleSwitch(x=tx, y=ty, w=tw, h=th)
 
+        # Text rows under the title never move; resolve them once
+        try:
+            _, title_h = oled._text_size(oled.f_arvo20, "Ag")
+        except Exception:
+            title_h = 20
+        self._status_y = self._top_pad + title_h + 2
+
+        # Status row box for the dot animation: left of the toggle, one
+        # med line tall
+        try:
+            _, med_h = oled._text_size(oled.f_med, "Ag")
+        except Exception:
+            med_h = 13
+        self._status_box = (min(tx, w), med_h)
+        # fb.gen of our last full frame (None = panel holds something else)
+        self._gen_sent = None
+
         self._load_cfg()
 
-        self.client = TelemetryClient(
-            api_base=self.api_base,
-            device_id=self.device_id,
-            device_key=self.device_key
-        )
+        self.client = _get_client(self.api_base, self.device_id, self.device_key)
 
         self._status = ""
         self._detail = ""
@@ -70,6 +117,17 @@ class OnlineScreen:
         self.device_key = self.cfg.get("device_key", "")
         self._online_enabled = bool(self.cfg.get("telemetry_enabled", True))
 
+        # ID / masked key lines only change with the config
+        self._id_str = "ID: " + (self.device_id or "---")[:14]
+        key = self.device_key or ""
+        if len(key) > 5:
+            key_disp = key[:5] + "*" * min(5, len(key) - 5)
+        elif key:
+            key_disp = key
+        else:
+            key_disp = "---"
+        self._key_str = "Key: " + key_disp
+
     def _save_enabled(self):
         self.cfg["telemetry_enabled"] = self._online_enabled
         save_config(self.cfg)
@@ -98,16 +156,10 @@ class OnlineScreen:
             except Exception:
                 pass
 
-        title_y = self._top_pad
-        o.f_arvo20.write("Online", 0, title_y)
-
-        try:
-            _, title_h = o._text_size(o.f_arvo20, "Ag")
-        except Exception:
-            title_h = 20
+        o.f_arvo20.write("Online", 0, self._top_pad)
 
         line_h = 13
-        status_y = title_y + title_h + 2
+        status_y = self._status_y
 
         # Status: animated dots while connecting, then API online/offline
         if self._connecting:
@@ -116,24 +168,32 @@ class OnlineScreen:
             status_text = "API online"
         else:
             status_text = "API offline"
-        o.f_med.write(status_text[:18], 0, status_y)
+        write = o.f_med.write
+        write(status_text[:18], 0, status_y)
 
-        # Device ID in med font
-        did = (self.device_id or "---")[:14]
-        o.f_med.write("ID: " + did, 0, status_y + line_h)
-
-        # Masked device key in med font
-        key = self.device_key or ""
-        if len(key) > 5:
-            key_disp = key[:5] + "*" * min(5, len(key) - 5)
-        elif key:
-            key_disp = key
-        else:
-            key_disp = "---"
-        o.f_med.write("Key: " + key_disp, 0, status_y + line_h * 2)
+        # Device ID and masked device key in med font (built in _load_cfg)
+        write(self._id_str, 0, status_y + line_h)
+        write(self._key_str, 0, status_y + line_h * 2)
 
         self.toggle.draw(fb, on=self._connected)
         fb.show()
+        self._gen_sent = fb.gen
+
+    def _draw_status_line(self):
+        """
+        Redraw just the status row ("Connecting" + dots) and push its pages.
+        Falls back to a full _draw() if another screen drew since ours.
+        """
+        fb = self.oled.oled
+        if self._gen_sent is None or fb.gen != self._gen_sent:
+            self._draw()
+            return
+        y = self._status_y
+        bw, bh = self._status_box
+        fb.fill_rect(0, y, bw, bh, 0)
+        # animation frames are all well under the 18-char cap
+        self.oled.f_med.write(self._status, 0, y)
+        fb.show_region(0, y >> 3, bw - 1, (y + bh - 1) >> 3)
 
     # ----------------------------
     # Helpers
@@ -146,7 +206,9 @@ class OnlineScreen:
             return False
 
     def _now_unix_seconds(self):
-        y, mo, d, wd, hh, mm, ss, sub = RTC().datetime()
+        # From the RTC datetime, not time.time() (epoch 0 on cold boot until
+        # synced; see telemetry_payload)
+        y, mo, d, wd, hh, mm, ss, sub = self._rtc.datetime()
         try:
             return int(time.mktime((y, mo, d, hh, mm, ss, wd, 0)))
         except Exception:
@@ -162,20 +224,18 @@ class OnlineScreen:
             self._dot_phase = 0
             self._next_anim_ms = time.ticks_ms()
 
-    def _tick_connecting(self):
+    def _tick_connecting(self, now):
         if not self._connecting:
             return
 
-        now = time.ticks_ms()
         if time.ticks_diff(now, self._next_anim_ms) < 0:
             return
 
         self._next_anim_ms = time.ticks_add(now, 400)
-        self._dot_phase = (self._dot_phase + 1) % 4
-        dots = "." * self._dot_phase
-        self._status = "Connecting" + dots
+        self._dot_phase = (self._dot_phase + 1) & 3
+        self._status = self._CONNECTING[self._dot_phase]
         self._detail = ""
-        self._draw()
+        self._draw_status_line()
 
     # ----------------------------
     # Handshake
@@ -199,8 +259,9 @@ class OnlineScreen:
             self._draw()
             return
 
-        gc.collect()
-        time.sleep_ms(150)
+        # show_live() did a full collect on entry; only re-collect if the
+        # heap has grown since (e.g. a re-handshake after toggling)
+        gc_maybe()
 
         payload = {
             "recorded_at": self._now_unix_seconds(),
@@ -229,6 +290,9 @@ class OnlineScreen:
         btn.reset()
         self._load_cfg()
 
+        # One full collect up front so the handshake POST has room
+        gc.collect()
+
         self._connected = False
 
         if not self._online_enabled:
@@ -252,8 +316,10 @@ class OnlineScreen:
                 except Exception:
                     pass
                 _tick_next = time.ticks_add(now, _tick_every)
+                # tick_fn may have spent a while on the network
+                now = time.ticks_ms()
 
-            self._tick_connecting()
+            self._tick_connecting(now)
 
             try:
                 action = btn.poll_action()
@@ -285,10 +351,17 @@ class OnlineScreen:
                 return "quad"
 
             if self._online_enabled and self._handshake_pending:
-                now = time.ticks_ms()
                 if time.ticks_diff(now, self._next_handshake_ms) >= 0:
                     self._handshake_pending = False
                     self._set_connecting(False)
                     self._handshake()
 
-            time.sleep_ms(25)
\ No newline at end of file
+            # Sleep until the next tick / dot frame / handshake (or a press);
+            # re-read the clock, a draw or the handshake may have run
+            now = time.ticks_ms()
+            wait = 500 if tick_fn is None else time.ticks_diff(_tick_next, now)
+            if self._connecting:
+                wait = min(wait, time.ticks_diff(self._next_anim_ms, now))
+            if self._online_enabled and self._handshake_pending:
+                wait = min(wait, time.ticks_diff(self._next_handshake_ms, now))
+            idle_wait(btn, wait)
\ No newline at end of file
@@ -1,8 +1,28 @@
 import time
+import framebuf
+from src.ui.clicks import idle_wait
 from src.ui.glyphs import draw_circle  # harmless import if you already use glyphs
 from src.ui.faces import draw_face     # uses your face helper (we'll call grin explicitly)
 
 
+# Punchline grin, rendered once into a tile just wide enough for the face
+# (draw_face centres it when right_edge=False). Module level so it outlives
+# the screen object, which main drops on every flow exit.
+_GRIN = None
+
+
+def _grin_tile(band_h):
+    global _GRIN
+    if _GRIN is None or _GRIN[2] != band_h:
+        r = int((band_h * 0.90) / 2)
+        r = max(10, min(r, (band_h // 2) - 2))
+        tw = 2 * r + 2
+        tile = framebuf.FrameBuffer(bytearray(tw * ((band_h + 7) // 8)), tw, band_h, framebuf.MONO_VLSB)
+        draw_face(tile, tw, band_h, "grin", right_edge=False)
+        _GRIN = (tile, r + 1, band_h)
+    return _GRIN[0], _GRIN[1]
+
+
 class SelfDestructScreen:
     """
     Easter egg: mock self-destruct sequence.
@@ -26,14 +46,27 @@ class SelfDestructScreen:
     def __init__(self, oled):
         self.oled = oled
 
+        # Centered x per (writer, text) for this run. Kept local rather than
+        # in OLED._text_size's shared memo: the 21 countdown numbers would
+        # fill that and flush every other screen's cached labels.
+        self._xcache = {}
+
+        # Countdown frame on the panel: fb.gen after its push (None = panel
+        # holds something else) and the abort line it showed
+        self._cd_gen = None
+        self._cd_abort = None
+
     def _center_text(self, writer, text, y):
-        o = self.oled
         text = str(text)
-        try:
-            w, _ = o._text_size(writer, text)
-            x = max(0, (o.width - w) // 2)
-        except Exception:
-            x = 0
+        key = (id(writer), text)
+        x = self._xcache.get(key)
+        if x is None:
+            try:
+                w, _ = writer.size(text)
+                x = max(0, (self.oled.width - w) // 2)
+            except Exception:
+                x = 0
+            self._xcache[key] = x
         try:
             writer.write(text, x, y)
         except Exception:
@@ -42,11 +75,14 @@ class SelfDestructScreen:
 
     def _wait_ms_abortable(self, btn, ms, treat_any_click_as_abort=True):
         """
-        Wait ms in small increments.
+        Wait up to ms, sleeping until a button edge or the deadline.
         Returns True if a click happened during the wait.
         """
-        start = time.ticks_ms()
-        while time.ticks_diff(time.ticks_ms(), start) < int(ms):
+        deadline = time.ticks_add(time.ticks_ms(), int(ms))
+        while True:
+            left = time.ticks_diff(deadline, time.ticks_ms())
+            if left <= 0:
+                break
             a = None
             try:
                 a = btn.poll_action()
@@ -59,30 +95,59 @@ class SelfDestructScreen:
                 if a in ("single", "double", "triple", "quad"):
                     return True
 
-            time.sleep_ms(25)
+            idle_wait(btn, left)
         return False
 
+    def _draw_countdown_number(self, n):
+        o = self.oled
+        center = self._center_text
+        num = str(n)
+        # Big countdown number (use LARGE font from TimeScreen if available)
+        try:
+            center(o.f_large, num, 18)
+        except Exception:
+            try:
+                center(o.f_arvo24, num, 20)
+            except Exception:
+                center(o.f_arvo20, num, 22)
+
     def _draw_countdown_view(self, n, abort_line):
+        """
+        Page layout: warning in pages 0-1 (y 0), number in pages 2-5
+        (y 18, LARGE is 29px), abort line in pages 6-7 (y 52). Once a full
+        frame is on the panel, later ticks redraw and push only the number
+        band, plus the abort band when its text changed.
+        """
         o = self.oled
         fb = o.oled
+        w = o.width
+        f_med = o.f_med
+
+        if self._cd_gen is not None and fb.gen == self._cd_gen:
+            fb.fill_rect(0, 16, w, 32, 0)
+            self._draw_countdown_number(n)
+            p1 = 5
+            if abort_line != self._cd_abort:
+                fb.fill_rect(0, 48, w, 16, 0)
+                self._center_text(f_med, abort_line, 52)
+                self._cd_abort = abort_line
+                p1 = 7
+            fb.show_region(0, 2, w - 1, p1)
+            return
+
         fb.fill(0)
 
         # Top warning (MED, centered, ALL CAPS)
-        self._center_text(o.f_med, "STAND CLEAR 10M!", 0)
+        self._center_text(f_med, "STAND CLEAR 10M!", 0)
 
-        # Big countdown number (use LARGE font from TimeScreen if available)
-        try:
-            self._center_text(o.f_large, str(n), 18)
-        except Exception:
-            try:
-                self._center_text(o.f_arvo24, str(n), 20)
-            except Exception:
-                self._center_text(o.f_arvo20, str(n), 22)
+        self._draw_countdown_number(n)
 
         # Bottom line (MED, centered)
-        self._center_text(o.f_med, abort_line, 52)
+        self._center_text(f_med, abort_line, 52)
 
         fb.show()
+        self._cd_gen = fb.gen
+        self._cd_abort = abort_line
 
     def show(self, btn):
         btn.reset()
@@ -129,7 +194,8 @@ class SelfDestructScreen:
 
         top_h = max(24, int(o.height // 2))  # 32 on 64px OLED; never let it get tiny
         try:
-            draw_face(fb, o.width, top_h, "grin", right_edge=False)
+            tile, cx = _grin_tile(top_h)
+            fb.blit(tile, o.width // 2 - cx, 0, 0)
         except Exception:
             # fallback: smaller face in top half
             cx = int(o.width // 2)
@@ -187,5 +253,6 @@ class SelfDestructScreen:
                 a = None
 
             if a in ("single", "double", "triple", "quad", "debug"):
+                self._xcache.clear()
                 return "next"
-            time.sleep_ms(25)
\ No newline at end of file
+            idle_wait(btn, 500)
\ No newline at end of file
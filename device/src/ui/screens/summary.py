@@ -1,8 +1,53 @@
 # src/ui/screens/summary.py — Summary screen (Pico / MicroPython safe)
 
 import time
+import framebuf
+import micropython
 from src.ui.glyphs import draw_circle, draw_degree, draw_c, draw_sub2
 from src.ui.faces import draw_face
+from src.ui.clicks import idle_wait
+
+
+@micropython.viper
+def _classify(ppm: int, tvoc: int, ready: int) -> int:
+    # Severity 0..4 (good, ok, poor, bad, verybad): the worse of the CO2
+    # and TVOC tiers; 2 ("poor") while the sensor isn't ready.
+    #   CO2  (ppm): <800 | <1200 | <2000 | <5000 | >=5000
+    #   TVOC (ppb): <200 | <600  | <2000 | <5000 | >=5000
+    if ready == 0 or ppm <= 0:
+        return 2
+    c = 0
+    if ppm >= 800:
+        c = 1
+        if ppm >= 1200:
+            c = 2
+            if ppm >= 2000:
+                c = 3
+                if ppm >= 5000:
+                    c = 4
+    t = 0
+    if tvoc >= 200:
+        t = 1
+        if tvoc >= 600:
+            t = 2
+            if tvoc >= 2000:
+                t = 3
+                if tvoc >= 5000:
+                    t = 4
+    return c if c > t else t
+
+
+def _quant(v, nd):
+    # Reading value at its on-screen resolution (nd decimals), None when
+    # missing/non-numeric: sub-resolution jitter then keys the same frame.
+    try:
+        return round(float(v), nd)
+    except Exception:
+        return None
+
+
+# draw_face() mood per severity level (_classify() returns 0..4)
+_MOODS = ("good", "ok", "poor", "bad", "verybad")
 
 
 class SummaryScreen:
@@ -13,60 +58,37 @@ class SummaryScreen:
         self.indent_x = 14
         self.top_y = 4
 
+        _, h = oled._text_size(self.f, "Ag")
+        self._line_h = h + 2
+
+        # Face tile: draw_face() output for the current mood, rendered once
+        # into a buffer covering just the face's box (right edge, full
+        # height) and blitted per frame. Only the last mood is kept; it
+        # changes far less often than the 1 s refresh.
+        h = oled.height
+        r = int((h * 0.90) / 2)
+        r = max(10, min(r, (h // 2) - 2))
+        self._face_w = 2 * r + 2
+        self._face_x = oled.width - self._face_w
+        self._face_tile = None
+        self._face_mood = None
+
+        # Inputs of the frame on the panel, and fb.gen when it was pushed
+        # (None = panel holds something else). Unchanged readings only
+        # need the heartbeat redrawn.
+        self._last_key = None
+        self._gen_sent = None
+
     # -------------------------------------------------
     # Classification (score + mood)
     # -------------------------------------------------
-    def _score_from_reading(self, r):
+    def _score_from_values(self, eco2, tvoc, ready):
         """
         Returns lvl 0..4
           0 good, 1 ok, 2 poor, 3 bad, 4 verybad
         """
-        ppm = int(getattr(r, "eco2_ppm", 0) or 0)
-        tvoc = int(getattr(r, "tvoc_ppb", 0) or 0)
-        ready = bool(getattr(r, "ready", True))
-
-        if (not ready) or (ppm <= 0):
-            return 2  # "poor" default when not ready
-
-        # --- CO2 severity (0..4) ---
-        if ppm < 800:
-            co2_lvl = 0
-        elif ppm < 1200:
-            co2_lvl = 1
-        elif ppm < 2000:
-            co2_lvl = 2
-        elif ppm < 5000:
-            co2_lvl = 3
-        else:
-            co2_lvl = 4
-
-        # --- TVOC severity (0..4) ---
-        if tvoc <= 0:
-            tvoc_lvl = 0
-        elif tvoc < 200:
-            tvoc_lvl = 0
-        elif tvoc < 600:
-            tvoc_lvl = 1
-        elif tvoc < 2000:
-            tvoc_lvl = 2
-        elif tvoc < 5000:
-            tvoc_lvl = 3
-        else:
-            tvoc_lvl = 4
-
-        # Conservative combine: take the worse
-        return co2_lvl if co2_lvl > tvoc_lvl else tvoc_lvl
-
-    def _mood_from_score(self, lvl):
-        if lvl <= 0:
-            return "good"
-        if lvl == 1:
-            return "ok"
-        if lvl == 2:
-            return "poor"
-        if lvl == 3:
-            return "bad"
-        return "verybad"
+        # Coerce once here; the tier compares run as native code
+        return _classify(int(eco2 or 0), int(tvoc or 0), 1 if ready else 0)
 
     # -------------------------------------------------
     # Lines
@@ -75,43 +97,34 @@ class SummaryScreen:
         """
         MED: 29.7°C (degree ring pixel + C)
         """
-        if temp_c is None:
-            self.f.write("--.-", x, y)
-            return
-
-        try:
-            t = round(float(temp_c), 1)
-            num = "{:.1f}".format(t)
-        except Exception:
-            self.f.write("--.-", x, y)
+        f = self.f
+        o = self.oled
+        num = None if temp_c is None else o._dec1_text(temp_c)
+        if num is None:
+            f.write("--.-", x, y)
             return
 
-        self.f.write(num, x, y)
-        w_num, _ = self.oled._text_size(self.f, num)
+        f.write(num, x, y)
+        w_num = o._num_width(f, num)
 
         deg_r = 2
         deg_w = deg_r * 2 + 1
-        x_deg = x + int(w_num) + 1
-        draw_degree(self.oled.oled, x_deg, y + 3, r=deg_r, color=1)
+        x_deg = x + w_num + 1
+        draw_degree(o.oled, x_deg, y + 3, r=deg_r, color=1)
 
         x_c = x_deg + deg_w + 1
-        if not self.f.write("C", x_c, y):
-            draw_c(self.oled.oled, x_c, y + 2, scale=1, color=1)
+        if not f.write("C", x_c, y):
+            draw_c(o.oled, x_c, y + 2, scale=1, color=1)
 
     def _draw_humidity_line(self, rh, score, x, y):
         """
         MED: 67% | 2
         """
-        if rh is None:
-            txt = "--% | {}".format(score)
-            self.f.write(txt, x, y)
-            return
-
         try:
-            rh_i = int(round(float(rh)))
-            txt = "{}% | {}".format(rh_i, int(score))
+            txt = "%d%% | %d" % (int(round(float(rh))), score)
         except Exception:
-            txt = "--% | {}".format(score)
+            # rh None / not numeric
+            txt = "--%% | %d" % score
 
         self.f.write(txt, x, y)
 
@@ -120,36 +133,30 @@ class SummaryScreen:
         MED: 638 CO₂
         (CO + sub2 glyph)
         """
-        if eco2 is None:
-            self.f.write("-- CO", x, y)
-            # sub2 after "CO"
-            w, _ = self.oled._text_size(self.f, "-- CO")
-            draw_sub2(self.oled.oled, x + int(w) + 1, y + 9, scale=1, color=1)
-            return
-
+        # write "<n> CO"
         try:
-            n = str(int(eco2))
+            base = "%d CO" % int(eco2)
         except Exception:
-            n = "--"
+            # eco2 None / not numeric
+            base = "-- CO"
+        f = self.f
+        f.write(base, x, y)
 
-        # write "<n> CO"
-        base = "{} CO".format(n)
-        self.f.write(base, x, y)
-
-        w_base, _ = self.oled._text_size(self.f, base)
+        o = self.oled
+        w_base = o._num_width(f, base)
         # subscript sits a bit lower than baseline (tuned for MED)
-        draw_sub2(self.oled.oled, x + int(w_base) + 1, y + 9, scale=1, color=1)
+        draw_sub2(o.oled, x + w_base + 1, y + 9, scale=1, color=1)
 
     def _draw_tvoc_line(self, tvoc, x, y):
-        if tvoc is None:
-            self.f.write("-- ppb", x, y)
-            return
         try:
-            self.f.write(str(int(tvoc)) + " ppb", x, y)
+            txt = "%d ppb" % int(tvoc)
         except Exception:
-            self.f.write("-- ppb", x, y)
+            # tvoc None / not numeric
+            txt = "-- ppb"
+        self.f.write(txt, x, y)
 
     def _draw_heartbeat_icon(self, x, y, filled):
+        # 9x9 box at (x, y + 2)
         r = 4
         cx = x + r
         cy = y + 6
@@ -158,16 +165,19 @@ class SummaryScreen:
     # -------------------------------------------------
     # Layout
     # -------------------------------------------------
-    def _draw_left_column(self, r, x, y, beat_filled=False):
-        _, h = self.oled._text_size(self.f, "Ag")
-        line_h = h + 2
-
-        eco2 = getattr(r, "eco2_ppm", None) if r else None
-        tvoc = getattr(r, "tvoc_ppb", None) if r else None
-        temp_c = getattr(r, "temp_c", None) if r else None
-        rh = getattr(r, "humidity", None) if r else None
+    def _draw_left_column(self, vals, x, y, beat_filled=False):
+        """
+        vals: (eco2, tvoc, temp_c, rh, ready) as pulled in render(), or
+        None when there is no reading yet.
+        """
+        line_h = self._line_h
 
-        score = self._score_from_reading(r) if r else 2
+        if vals is not None:
+            eco2, tvoc, temp_c, rh, ready = vals
+            score = self._score_from_values(eco2, tvoc, ready)
+        else:
+            eco2 = tvoc = temp_c = rh = None
+            score = 2
 
         # CO2 + heartbeat
         self._draw_heartbeat_icon(x=2, y=y, filled=beat_filled)
@@ -191,26 +201,61 @@ class SummaryScreen:
     # Render
     # -------------------------------------------------
     def render(self, reading, beat_filled=False):
-        self.oled.oled.fill(0)
+        fb = self.oled.oled
+        # Pull the reading's fields once; they key the skip check below and
+        # feed both the text and the score. Temp/RH are keyed as displayed
+        # (0.1 C, whole %) so noise below that doesn't force a full frame.
+        r = reading
+        if r:
+            key = (
+                getattr(r, "eco2_ppm", None),
+                getattr(r, "tvoc_ppb", None),
+                _quant(getattr(r, "temp_c", None), 1),
+                _quant(getattr(r, "humidity", None), 0),
+                bool(getattr(r, "ready", True)),
+            )
+        else:
+            key = None
+
+        if self._gen_sent is not None and fb.gen == self._gen_sent and key == self._last_key:
+            # Same text and face as on the panel: only the heartbeat toggles
+            y = self.top_y + 2
+            fb.fill_rect(2, y, 9, 9, 0)
+            self._draw_heartbeat_icon(x=2, y=self.top_y, filled=beat_filled)
+            fb.show_region(2, y >> 3, 10, (y + 8) >> 3)
+            return
+
+        fb.fill(0)
 
         score = self._draw_left_column(
-            reading,
+            key,
             x=self.indent_x,
             y=self.top_y,
             beat_filled=beat_filled
         )
 
-        mood = self._mood_from_score(score)
-        draw_face(
-            self.oled.oled,
-            self.oled.width,
-            self.oled.height,
-            mood,
-            right_edge=True,
-            fill_height_ratio=0.90
-        )
-
-        self.oled.oled.show()
+        fb.blit(self._get_face_tile(_MOODS[score]), self._face_x, 0, 0)
+
+        fb.show()
+        self._last_key = key
+        self._gen_sent = fb.gen
+
+    def _get_face_tile(self, mood):
+        if mood != self._face_mood:
+            h = self.oled.height
+            tile = self._face_tile
+            if tile is None:
+                tile = framebuf.FrameBuffer(
+                    bytearray(self._face_w * ((h + 7) // 8)), self._face_w, h, framebuf.MONO_VLSB
+                )
+                self._face_tile = tile
+            else:
+                tile.fill(0)
+            # Same radius/centre as on the full screen: draw_face keys both
+            # off the height and the right edge
+            draw_face(tile, self._face_w, h, mood, right_edge=True, fill_height_ratio=0.90)
+            self._face_mood = mood
+        return self._face_tile
 
     def show(self, reading):
         self.render(reading, beat_filled=False)
@@ -219,10 +264,12 @@ class SummaryScreen:
     # Live mode (1 second refresh, button-friendly)
     # -------------------------------------------------
     def show_live(self, get_reading, btn=None, refresh_ms=1000, max_seconds=0, tick_fn=None):
+        rms = int(refresh_ms)
+        max_ms = int(max_seconds * 1000) if max_seconds and max_seconds > 0 else 0
         start = time.ticks_ms()
         last_good = None
         beat = False
-        _tick_next = time.ticks_ms()
+        _tick_next = start
         _tick_every = 500
 
         while True:
@@ -245,16 +292,20 @@ class SummaryScreen:
 
             self.render(r if r is not None else last_good, beat_filled=beat)
 
-            wait_start = time.ticks_ms()
-            while time.ticks_diff(time.ticks_ms(), wait_start) < int(refresh_ms):
+            # Poll the button until the next frame is due, sleeping the
+            # remainder (or until a press) between polls
+            deadline = time.ticks_add(time.ticks_ms(), rms)
+            while True:
                 if btn is not None:
                     try:
                         if btn.poll_action():
                             return
                     except Exception:
                         pass
-                time.sleep_ms(20)
+                left = time.ticks_diff(deadline, time.ticks_ms())
+                if left <= 0:
+                    break
+                idle_wait(btn, left, 20)
 
-            if max_seconds and max_seconds > 0:
-                if time.ticks_diff(time.ticks_ms(), start) >= int(max_seconds * 1000):
-                    return
+            if max_ms and time.ticks_diff(time.ticks_ms(), start) >= max_ms:
+                return
@@ -16,6 +16,7 @@ import time
 from src.ui.glyphs import draw_degree, draw_clock, CLOCK_W, CLOCK_H
 import src.ui.connection_header as _ch
 from src.ui.connection_header import GPS_NONE
+from src.ui.clicks import idle_wait
 
 
 class TempScreen:
@@ -31,22 +32,15 @@ class TempScreen:
         # the telemetry scheduler always sees the latest DS3231 temperature.
         self._rtc_info = rtc_info if isinstance(rtc_info, dict) else None
 
+        # Fixed-string metrics, measured once (fonts never change)
+        _, self._h_med = oled._text_size(oled.f_med, "Ag")
+        _, self._h_large = oled._text_size(oled.f_large, "8")
+        self._w_c_med, self._h_c_med = oled._text_size(oled.f_med, "C")
+
     # -------------------------------------------------
     # Helpers
     # -------------------------------------------------
 
-    @staticmethod
-    def _round_1dp(x):
-        try:
-            return round(float(x), 1)
-        except Exception:
-            return None
-
-    def _format_temp(self, t):
-        if t is None:
-            return None
-        return "{:.1f}".format(t)
-
     def _read_rtc_temp(self):
         """
         Read a fresh temperature directly from the DS3231 chip.
@@ -83,7 +77,7 @@ class TempScreen:
             return
 
         w_num, h_large = self.oled._text_size(f_l, temp_str)
-        w_c,   h_med   = self.oled._text_size(f_m, "C")
+        w_c,   h_med   = self._w_c_med, self._h_c_med
         deg_r = 2
         deg_w = deg_r * 2 + 1
         gap1  = 2
@@ -120,10 +114,14 @@ class TempScreen:
         except Exception:
             return
 
-        f = self.oled.f_med
-        val_str = "{}".format(t)
-        w_val, h_val = self.oled._text_size(f, val_str)
-        w_c,   _     = self.oled._text_size(f, "C")
+        o = self.oled
+        f = o.f_med
+        # Integer string reused across repeats; width from per-char advances
+        # (no per-value memo entry), height is the font's line height.
+        val_str = o._num_text(t)
+        w_val = o._num_width(f, val_str)
+        h_val = self._h_med
+        w_c   = self._w_c_med
         deg_r = 2
         deg_w = deg_r * 2 + 1
         gap   = 2
@@ -171,6 +169,7 @@ class TempScreen:
         """
         if refresh_ms is None:
             refresh_ms = self.REFRESH_MS
+        rms = int(refresh_ms)
 
         if get_reading is None:
             if air is not None:
@@ -217,7 +216,7 @@ class TempScreen:
                     pass
 
                 self._draw_screen(reading, rtc_temp_c)
-                next_refresh = time.ticks_add(now, int(refresh_ms))
+                next_refresh = time.ticks_add(now, rms)
 
             action = None
             if btn is not None:
@@ -229,7 +228,12 @@ class TempScreen:
             if action == "single":
                 return action
 
-            time.sleep_ms(self.POLL_MS)
+            # Sleep until the next refresh / tick is due (or a press)
+            now = time.ticks_ms()
+            wait = time.ticks_diff(next_refresh, now)
+            if tick_fn is not None:
+                wait = min(wait, time.ticks_diff(_tick_next, now))
+            idle_wait(btn, wait, self.POLL_MS)
 
     # -------------------------------------------------
     # Core draw
@@ -239,8 +243,8 @@ class TempScreen:
         self.oled.oled.fill(0)
 
         f = self.oled.f_med
-        _, h_med   = self.oled._text_size(f, "Ag")
-        _, h_large = self.oled._text_size(self.oled.f_large, "8")
+        h_med   = self._h_med
+        h_large = self._h_large
 
         # --- Connectivity icons (top-right) ---
         st = self._status
@@ -263,10 +267,8 @@ class TempScreen:
             if temp_c is None:
                 temp_c = getattr(reading, "temp_c", None)
 
-        if temp_c is not None:
-            temp_c = self._round_1dp(temp_c)
-
-        temp_str = self._format_temp(temp_c)
+        # None -> "--.-" placeholder in _draw_main_temp
+        temp_str = None if temp_c is None else self.oled._dec1_text(temp_c)
 
         y_top        = h_med + 2
         y_bottom_row = self.oled.height - h_med - 1
@@ -47,6 +47,10 @@ class TimeScreen:
         # API refresh happens once per screen open
         self._tz_checked = False
 
+        # Fixed-string metrics, measured once (fonts never change)
+        _, self._h_med = oled._text_size(oled.f_med, "Ag")
+        _, self._h_large = oled._text_size(oled.f_large, "8")
+
     # -------------------------------------------------
     # RTC / tuples
     # -------------------------------------------------
@@ -146,6 +150,8 @@ class TimeScreen:
                         self.cfg["timezone_offset_min"] = tz_off
                         with open(CONFIG_FILE, "w") as f:
                             json.dump(self.cfg, f)
+                        from config import invalidate_config_cache
+                        invalidate_config_cache()
                 except Exception:
                     pass
 
@@ -243,10 +249,9 @@ class TimeScreen:
             except Exception:
                 pass
 
-        # --- Measure fonts ---
-        _, h_med   = self.oled._text_size(self.oled.f_med,   "Ag")
-        _, h_small = self.oled._text_size(self.oled.f_small, "Ag")
-        _, h_large = self.oled._text_size(self.oled.f_large, "8")
+        # --- Font metrics (measured once in __init__) ---
+        h_med   = self._h_med
+        h_large = self._h_large
 
         # --- Top-left: UTC time ---
         self._draw_top_left_utc(y=1)
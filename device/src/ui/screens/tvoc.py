@@ -2,8 +2,8 @@
 # TVOC screen for AirBuddy
 # Pico / MicroPython safe
 
-from src.ui.thermobar import ThermoBar
-from src.ui.glyphs import draw_face9
+from src.ui.thermobar import ThermoBar, step_table, step_lookup
+from src.ui.glyphs import draw_face9, MOOD_GOOD, MOOD_VERYBAD
 
 
 class TVOCScreen:
@@ -22,6 +22,14 @@ class TVOCScreen:
 
     DISPLAY_DURATION = 4
 
+    # ppb -> step mapping edges (11 points = 10 bins), see _tvoc_to_step
+    _EDGES = (0, 60, 120, 180, 220, 400, 660, 1200, 2200, 3500, 5500)
+    _STEPS = step_table(_EDGES)
+
+    # Static word sprites, rendered once per display by _init_sprites()
+    # and shared by every instance (main.py rebuilds screens on each visit)
+    _sprites_oled = None
+
     def __init__(self, oled):
         self.oled = oled
 
@@ -45,14 +53,15 @@ class TVOCScreen:
 
 # Layout tuning (match CO2)
         self.bar_x = 2
-        self.bar_w = int(self.oled.width) - 4
+        self._screen_w = int(self.oled.width)
+        self.bar_w = self._screen_w - 4
 
         self.scale_y = 34
         self.bar_y = 45  # lowered by 2px to avoid touching numbers
 
         # Bottom labels (faces at ends + text middle)
-        self.left_face = "good"
-        self.right_face = "verybad"
+        self.left_face = MOOD_GOOD
+        self.right_face = MOOD_VERYBAD
 
         self.faces_y = max(0, int(self.oled.height) - 9)
         _, h_vs = self.oled._text_size(self.f_vs, "Ag")
@@ -61,6 +70,7 @@ class TVOCScreen:
         self.left_face_x = 2
         self.label_texts = ["OK", "POOR", "BAD"]
         self.label_x = [28, 56, 86]
+        self._labels = tuple(zip(self.label_texts, self.label_x))
         self.right_face_x = 110
 
         # Optional per-tick pixel nudges (like your CO2 trick)
@@ -71,11 +81,37 @@ class TVOCScreen:
             # 5500: -6,
         }
 
+        # Title width is fixed; measure once
+        w_title, _ = (self.f_arvo if self.f_arvo else self.f_med).size("TVOC")
+        self._w_title = int(w_title)
+
+        # Static per-frame geometry, resolved once: the tick x positions.
+        self._tick_xs = tuple(self._tick_x_for_label_center(v) for v in self.tick_ppb)
+
+        # Static labels pre-rendered once; per frame they're single blits
+        # instead of ezFBfont's per-character loop.
+        if TVOCScreen._sprites_oled is not oled:
+            self._init_sprites()
+
+    def _init_sprites(self):
+        cls = TVOCScreen
+        sprite = self.oled.text_sprite
+        scale_writer = self.f_small if self.f_small else self.f_vs
+        cls._scale_sprites = tuple(
+            (sprite(scale_writer, str(v)), int(x)) for v, x in zip(self.scale_ppb, self.scale_x)
+        )
+
+        # Header words never change either
+        cls._title_sprite = sprite(self.f_arvo if self.f_arvo else self.f_med, "TVOC")
+        cls._unit_sprite = sprite(scale_writer, "PPB")
+        cls._conf_sprite = sprite(scale_writer, "CONF")
+        cls._sprites_oled = self.oled
+
     # -------------------------------------------------
     # Public API
     # -------------------------------------------------
     def show(self, reading, confidence_pct=None):
-        self.oled.clear()
+        self.oled.reset_fb()
 
         tvoc = int(getattr(reading, "tvoc_ppb", 0))
         ready = bool(getattr(reading, "ready", True))
@@ -97,7 +133,7 @@ class TVOCScreen:
             conf_text = "XX%"
         else:
             conf = 0 if conf < 0 else 100 if conf > 100 else conf
-            conf_text = "{}%".format(conf)
+            conf_text = self.oled._num_text(conf, "%")
 
         not_ready = (not ready) or (tvoc <= 0)
 
@@ -116,16 +152,15 @@ class TVOCScreen:
         x0 = 2
         y0 = 0
 
-        # Title "TVOC" using Arvo16 if available, else MED
-        title_writer = self.f_arvo if self.f_arvo else self.f_med
-        title_writer.write("TVOC", x0, y0)
+        blit = self.oled.oled.blit
+
+        # Title "TVOC" using Arvo16 if available, else MED (pre-rendered)
+        blit(self._title_sprite, x0, y0)
 
         # Unit "PPB" in SMALL (fallback VSMALL) — same style as CO2
-        w_main, _ = title_writer.size("TVOC")
-        unit_writer = self.f_small if self.f_small else self.f_vs
-        unit_x = x0 + int(w_main) + 6
-        unit_y = y0 + (4 if unit_writer is self.f_small else 5)
-        unit_writer.write("PPB", unit_x, unit_y)
+        unit_x = x0 + self._w_title + 6
+        unit_y = y0 + (4 if self.f_small else 5)
+        blit(self._unit_sprite, unit_x, unit_y)
 
         # Status / confidence line (raised back up)
         status_y = 14  # original position
@@ -137,61 +172,51 @@ class TVOCScreen:
             conf_y = status_y  # no extra offset now
 
             conf_writer.write(conf_text, x0, conf_y)
-            w_pct, _ = conf_writer.size(conf_text)
-            conf_writer.write("CONF", x0 + int(w_pct) + 6, conf_y)
+            w_pct = self.oled._num_width(conf_writer, conf_text)
+            blit(self._conf_sprite, x0 + w_pct + 6, conf_y)
 
 
         # Value top-right, LARGE (only when ready)
         if not not_ready:
-            val = str(int(tvoc))
-            tw, _ = self.f_large.size(val)
-            x = int(self.oled.width) - int(tw) - 2
+            val = self.oled._num_text(tvoc)
+            tw = self.oled._num_width(self.f_large, val)
+            x = self._screen_w - tw - 2
             y = 2
             self.f_large.write(val, x, y)
 
     def _draw_scale_numbers(self):
-        # numbers above bar should be SMALL (fallback to VSMALL)
-        writer = self.f_small if self.f_small else self.f_vs
+        # numbers above bar are SMALL (fallback VSMALL), pre-rendered
         y = self.scale_y
-        for v, x in zip(self.scale_ppb, self.scale_x):
-            writer.write(str(v), int(x), int(y))
+        blit = self.oled.oled.blit
+        for spr, x in self._scale_sprites:
+            blit(spr, x, y)
 
-    def _tvoc_to_step_p(self, tvoc):
+    def _tvoc_to_step(self, tvoc):
         """
-        Map TVOC ppb into 10 discrete fill positions (0.0 .. 1.0 in steps of 0.1)
+        Map TVOC ppb into 10 discrete fill steps (int 0 .. 10, fill = step / 10)
         using bins aligned to your scale points.
 
         Bins:
           0..220..660..2200..5500 spread into 10 steps.
         """
-        edges = [0, 60, 120, 180, 220, 400, 660, 1200, 2200, 3500, 5500]
-
-        if tvoc <= edges[0]:
-            return 0.0
-        if tvoc >= edges[-1]:
-            return 1.0
-
-        for i in range(10):
-            if edges[i] <= tvoc < edges[i + 1]:
-                return (i + 1) / 10.0
-
-        return 1.0
+        return step_lookup(self._STEPS, tvoc)
 
     def _draw_bar(self, tvoc, not_ready):
-        p = 0.0 if not_ready else self._tvoc_to_step_p(int(tvoc))
+        k = 0 if not_ready else self._tvoc_to_step(tvoc)
 
         self.bar.draw(
             x=self.bar_x,
             y=self.bar_y,
             w=self.bar_w,
-            p=p,
+            p_num=k,
+            p_den=10,
             outline=True,
             clear_bg=False
         )
 
-        # Pointer at end of fill
+        # Pointer at end of fill: round(k/10 * (bar_w - 1)) in integers
         if not not_ready:
-            x_end = self.bar_x + int(round(p * (self.bar_w - 1)))
+            x_end = self.bar_x + (k * (self.bar_w - 1) * 2 + 10) // 20
             x_end = max(self.bar_x, min(self.bar_x + self.bar_w - 1, x_end))
             self.oled.oled.pixel(x_end, self.bar_y - 1, 1)
 
@@ -227,24 +252,22 @@ class TVOCScreen:
 
         return x_center
 
-    def _draw_tick(self, x):
-        # 1px taller than above the top border + crosses into bar
-        y0 = self.bar_y - 2
-        for yy in range(6):  # 6px tall
-            self.oled.oled.pixel(int(x), int(y0 + yy), 1)
-
     def _draw_fixed_ticks(self):
-        for v in self.tick_ppb:
-            x = self._tick_x_for_label_center(v)
-            self._draw_tick(x)
+        # 1px taller than above the top border + crosses into bar (6px tall)
+        vline = self.oled.oled.vline
+        y = self.bar_y - 2
+        for x in self._tick_xs:
+            vline(x, y, 6, 1)
 
     def _draw_bottom_labels(self):
+        fb = self.oled.oled
         y_face = self.faces_y
         y_text = self.labels_y
 
-        draw_face9(self.oled.oled, int(self.left_face_x), int(y_face), mood=self.left_face, scale=1, color=1)
+        draw_face9(fb, self.left_face_x, y_face, mood=self.left_face, scale=1, color=1)
 
-        for txt, x in zip(self.label_texts, self.label_x):
-            self.f_vs.write(txt, int(x), int(y_text))
+        write = self.f_vs.write
+        for txt, x in self._labels:
+            write(txt, x, y_text)
 
-        draw_face9(self.oled.oled, int(self.right_face_x), int(y_face), mood=self.right_face, scale=1, color=1)
+        draw_face9(fb, self.right_face_x, y_face, mood=self.right_face, scale=1, color=1)
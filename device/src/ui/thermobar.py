@@ -24,6 +24,60 @@
 #   bar.draw(p=0.5, mode="center")                 # center-expanding fill
 
 
+def step_index(edges, v):
+    """
+    Map v onto len(edges)-1 discrete bar steps (int): 0 at/below edges[0],
+    n at/above edges[-1], else k for edges[k-1] <= v < edges[k].
+    Binary search (bisect_right) instead of a linear bin scan; pair with
+    draw(p_num=k, p_den=n) to stay in integers end to end.
+    """
+    n = len(edges) - 1
+    if v <= edges[0]:
+        return 0
+    if v >= edges[n]:
+        return n
+    lo = 1
+    hi = n
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if edges[mid] > v:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def step_table(edges):
+    """
+    Precompute step_index() for integer edges as (lo, q, lut): q is the gcd
+    of the edges, so every bin boundary is a multiple of q and the step of
+    v is lut[v // q]. Tiny for the UI scales (e.g. 101 bytes for CO2).
+    """
+    q = 0
+    for e in edges:
+        a = e if e >= 0 else -e
+        while a:
+            q, a = a, q % a
+    if q <= 0:
+        q = 1
+    n = len(edges) - 1
+    # Entry for edges[0] serves v just above it (v <= lo is handled first)
+    lut = bytes(step_index(edges, i * q) if i * q != edges[0] else 1
+                for i in range(edges[n] // q + 1))
+    return edges[0], q, lut
+
+
+def step_lookup(table, v):
+    """step_index(edges, v) via a step_table(edges) LUT: one index, no search."""
+    lo, q, lut = table
+    if v <= lo:
+        return 0
+    i = v // q
+    if i >= len(lut):
+        return lut[-1]
+    return lut[i]
+
+
 class ThermoBar:
     def __init__(self, oled, x=0, y=0, width=100, height=7, invert=False):
         """
@@ -157,10 +211,15 @@ class ThermoBar:
 
     def draw(self, x=None, y=None, w=None, h=None, p=None,
              outline=True, clear_bg=True,
-             mode="left", indicator_p=None, indicator_ps=None):
+             mode="left", indicator_p=None, indicator_ps=None,
+             p_num=None, p_den=10):
         """
         Draw the bar.
 
+        p_num/p_den:
+          - integer fill fraction; when p_num is given it replaces p and
+            the fill width is computed without floats
+
         indicator_p:
           - single tick position in [0..1]
 
@@ -177,13 +236,16 @@ class ThermoBar:
         w = self.width if w is None else int(w)
         h = self.height if h is None else int(h)
 
-        if p is None:
-            p = 0.0
-        try:
-            p = float(p)
-        except Exception:
-            p = 0.0
-        p = self._clamp(p, 0.0, 1.0)
+        if p_num is None:
+            if p is None:
+                p = 0.0
+            try:
+                p = float(p)
+            except Exception:
+                p = 0.0
+            p = self._clamp(p, 0.0, 1.0)
+        else:
+            p_num = self._clamp(p_num, 0, p_den)
 
         if clear_bg:
             self._fill_rect(x, y, w, h, on=False)
@@ -193,7 +255,10 @@ class ThermoBar:
 
         inner_x, inner_y, inner_w, inner_h = self._inner_geom(x, y, w, h)
 
-        fill_w = int(inner_w * p)
+        if p_num is None:
+            fill_w = int(inner_w * p)
+        else:
+            fill_w = inner_w * p_num // p_den
         if fill_w <= 0:
             fill_w = 0
 
@@ -23,6 +23,7 @@
 
 import time
 import gc
+import framebuf
 from src.ui import logo_airbuddy
 from src.ui import connection_header
 from src.ui.connection_header import GPS_NONE, GPS_INIT, GPS_FIXED  # noqa: F401
@@ -49,6 +50,13 @@ class WaitingScreen:
         self._logo_lh = None
         self._logo_data = None
 
+        # Pre-rendered frames: flipped logo sprite (built once) and the
+        # 4 dot-animation phases of the tagline as text sprites (rebuilt
+        # only when the base line or writer changes).
+        self._logo_spr = None
+        self._line_key = None
+        self._line_ring = None
+
         self.logo_y_offset_px = -2
         self.line_y_offset_px = -6
 
@@ -82,6 +90,7 @@ class WaitingScreen:
         # ---- DEBUG ----
         # Keep False in normal runs; turn on temporarily if diagnosing.
         self.log_status_checks = False
+        self._last_logged_ret = None    # dedupe repeated status-check log lines
 
     # ============================================================
     # PUBLIC API (render once)
@@ -208,6 +217,7 @@ class WaitingScreen:
                 ret = on_idle(now)
                 if self.log_status_checks:
                     print("[WAITING] status check (entry) ->", ret)
+                    self._last_logged_ret = ret
                 self._apply_idle_ret(ret, now)
             except Exception as e:
                 if self.log_status_checks:
@@ -241,8 +251,10 @@ class WaitingScreen:
                 try:
                     if self._ticks_diff(now, self._idle_next_ms) >= 0:
                         ret = on_idle(now)
-                        if self.log_status_checks:
+                        if self.log_status_checks and ret != self._last_logged_ret:
+                            # Only log changes: steady-state checks repeat the same tuple
                             print("[WAITING] status check ->", ret)
+                            self._last_logged_ret = ret
 
                         self._apply_idle_ret(ret, now)
                         self._idle_next_ms = self._ticks_add(now, int(idle_every_ms))
@@ -414,6 +426,27 @@ class WaitingScreen:
             return base + ".."
         return base + "..."
 
+    def _get_line_ring(self, oled, writer, base):
+        """
+        (text, sprite) for each dot phase of base ("", ".", "..", "...").
+        Returns None when the OLED can't pre-render (falls back to write()).
+        """
+        key = (id(writer), base)
+        if self._line_key == key:
+            return self._line_ring
+
+        sprite = getattr(oled, "text_sprite", None)
+        ring = None
+        if sprite is not None:
+            try:
+                ring = tuple((t, sprite(writer, t)) for t in (base, base + ".", base + "..", base + "..."))
+            except Exception:
+                ring = None
+
+        self._line_key = key
+        self._line_ring = ring
+        return ring
+
     def _is_api_sending(self, now_ms):
         return self._ticks_diff(now_ms, self._api_sending_until_ms) < 0
 
@@ -447,28 +480,31 @@ class WaitingScreen:
         b = data[idx]
         return (b >> (y & 7)) & 1
 
-    def _blit_logo_fixed(self, oled, x0, y0, lw, lh, data):
-        sw = int(getattr(oled, "width", 128))
-        sh = int(getattr(oled, "height", 64))
-        fb = getattr(oled, "oled", None)
-        if fb is None:
-            return False
+    def _get_logo_sprite(self, lw, lh, data):
+        # Flip the logo once into its own MONO_VLSB FrameBuffer; per render
+        # it is then a single blit instead of lw*lh Python pixel tests.
+        spr = self._logo_spr
+        if spr is not None:
+            return spr
 
+        spr = framebuf.FrameBuffer(bytearray(lw * ((lh + 7) // 8)), lw, lh, framebuf.MONO_VLSB)
         for yy in range(lh):
             dy = (lh - 1 - yy) if self.flip_y else yy
-            sy = y0 + yy
-            if sy < 0 or sy >= sh:
-                continue
-
             for xx in range(lw):
                 dx = (lw - 1 - xx) if self.flip_x else xx
-                sx = x0 + xx
-                if sx < 0 or sx >= sw:
-                    continue
-
                 if self._logo_pixel(data, lw, dx, dy):
-                    fb.pixel(sx, sy, 1)
+                    spr.pixel(xx, yy, 1)
+
+        self._logo_spr = spr
+        return spr
+
+    def _blit_logo_fixed(self, oled, x0, y0, lw, lh, data):
+        fb = getattr(oled, "oled", None)
+        if fb is None:
+            return False
 
+        # key=0: only set pixels, like the old per-pixel draw (blit clips)
+        fb.blit(self._get_logo_sprite(lw, lh, data), x0, y0, 0)
         return True
 
     # ============================================================
@@ -530,7 +566,12 @@ class WaitingScreen:
 
         base = (line or "").rstrip().rstrip(". ")
         p = int(period_ms) or 1000
-        line_to_draw = base + "..." if not animate else self._animated_line(base, p)
+        ring = self._get_line_ring(oled, writer, base)
+        if ring is not None:
+            line_to_draw, line_spr = ring[self._anim_step(p) if animate else 3]
+        else:
+            line_spr = None
+            line_to_draw = base + "..." if not animate else self._animated_line(base, p)
 
         lw, lh, data = self._get_logo_cached()
         use_logo = (lw > 0 and lh > 0 and lw <= ow and lh <= oh and data is not None)
@@ -561,7 +602,10 @@ class WaitingScreen:
             x = 0
 
         try:
-            writer.write(line_to_draw, x, int(line_y))
+            if line_spr is not None:
+                fb.blit(line_spr, x, int(line_y))
+            else:
+                writer.write(line_to_draw, x, int(line_y))
         except Exception:
             pass
 
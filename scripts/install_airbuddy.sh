@@ -14,11 +14,15 @@ set -euo pipefail
 #   ./scripts/install_airbuddy.sh --board esp32
 #   ./scripts/install_airbuddy.sh --board pico
 #   ./scripts/install_airbuddy.sh --overwrite-config
+#   ./scripts/install_airbuddy.sh --mpy
 #
 # Notes:
 # - Flash MicroPython onto your board before running this.
 # - Generates config.json interactively and uploads it.
 # - Board type is auto-detected from sys.platform.
+# - --mpy precompiles the hot UI modules listed in MPY_MODULES with
+#   mpy-cross (must match the board's MicroPython version) so the
+#   board skips parsing/compiling them at boot.
 # ============================================================
 
 ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
@@ -30,6 +34,14 @@ PORT="auto"
 FRESH=0
 OVERWRITE_CONFIG=0
 BOARD_OVERRIDE=""
+BUILD_MPY=0
+
+# Modules shipped as .mpy when --mpy is given (paths relative to device/)
+MPY_MODULES=(
+  "src/ui/glyphs.py"
+  "src/drivers/ezFBfont.py"
+  "src/drivers/_glyph_viper.py"
+)
 
 # ------------------------------------------------------------
 # Helpers
@@ -47,6 +59,7 @@ Options:
   --overwrite-config   Replace existing config.json on the board
   --port PORT          Serial port to use (default: auto)
   --board TYPE         Force board type: esp32 or pico
+  --mpy                Precompile hot UI modules to .mpy (needs mpy-cross)
   --help               Show this help
 
 Examples:
@@ -159,6 +172,10 @@ while [[ $# -gt 0 ]]; do
       BOARD_OVERRIDE="$2"
       shift 2
       ;;
+    --mpy)
+      BUILD_MPY=1
+      shift
+      ;;
     --help)
       print_help
       exit 0
@@ -194,6 +211,10 @@ if ! command_exists mpremote; then
   die "mpremote isn't installed. Get it with: pip install mpremote"
 fi
 
+if [[ "$BUILD_MPY" -eq 1 ]] && ! command_exists mpy-cross; then
+  die "--mpy needs mpy-cross. Get it with: pip install mpy-cross (match your board's MicroPython version)"
+fi
+
 mkdir -p "$TMP_DIR"
 
 MPREMOTE=(mpremote connect "$PORT")
@@ -370,7 +391,32 @@ fi
 
 msg "Uploading AirBuddy firmware"
 
-"${MPREMOTE[@]}" fs cp -r "$DEVICE_DIR/." : || die "Failed to upload device files."
+UPLOAD_DIR="$DEVICE_DIR"
+
+if [[ "$BUILD_MPY" -eq 1 ]]; then
+  # Native-code functions (@micropython.native) need the board's arch.
+  case "$BOARD_TYPE" in
+    pico)  MPY_ARCH="armv6m" ;;
+    esp32) MPY_ARCH="xtensawin" ;;
+  esac
+
+  STAGE_DIR="$TMP_DIR/device"
+  rm -rf "$STAGE_DIR"
+  cp -r "$DEVICE_DIR" "$STAGE_DIR"
+  find "$STAGE_DIR" -name "__pycache__" -type d -prune -exec rm -rf {} +
+
+  for mod in "${MPY_MODULES[@]}"; do
+    echo "mpy-cross: $mod"
+    mpy-cross -O3 -march="$MPY_ARCH" "$STAGE_DIR/$mod" || die "mpy-cross failed for $mod"
+    rm -f "$STAGE_DIR/$mod"
+    # MicroPython imports .py before .mpy: drop any stale source on the board
+    "${MPREMOTE[@]}" fs rm ":$mod" >/dev/null 2>&1 || true
+  done
+
+  UPLOAD_DIR="$STAGE_DIR"
+fi
+
+"${MPREMOTE[@]}" fs cp -r "$UPLOAD_DIR/." : || die "Failed to upload device files."
 
 echo "Firmware uploaded."
 